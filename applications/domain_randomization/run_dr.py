@@ -15,7 +15,10 @@ from applications.util import get_agent, parse_config_file
 from rhucrl.agent import ADVERSARIAL_AGENTS, DR_AGENTS
 from rhucrl.environment import AdversarialEnv
 from rhucrl.environment.wrappers import MujocoDomainRandomizationWrapper
-from rhucrl.utilities.utilities import evaluate_domain_shift
+from rhucrl.utilities.utilities import (
+    evaluate_domain_shift,
+    evaluate_domain_shift_parallel,
+)
 
 parser = argparse.ArgumentParser("Robust Domain Randomization RL")
 
@@ -25,6 +28,12 @@ parser.add_argument("--num-threads", type=int, default=1, help="Number of thread
 parser.add_argument(
     "--num-eval-runs", type=int, default=5, help="Number of runs per parameter."
 )
+parser.add_argument(
+    "--num-eval-workers",
+    type=int,
+    default=1,
+    help="Number of processes that evaluate the domain shift grid.",
+)
 
 parser.add_argument(
     "--env-config",
@@ -105,10 +114,23 @@ try:
 except AttributeError:
     policy = agent.policy
 
-eval_agent = FixedPolicyAgent.default(environment, policy=policy)
-eval_agent.logger.change_log_dir(name)
-evaluate_domain_shift(
-    env_args=env_args, agent=eval_agent, seed=args.seed, num_runs=args.num_eval_runs
-)
+if args.num_eval_workers > 1:
+    eval_statistics = evaluate_domain_shift_parallel(
+        env_args=env_args,
+        policy=policy,
+        seed=args.seed,
+        num_runs=args.num_eval_runs,
+        num_workers=args.num_eval_workers,
+    )
+else:
+    eval_agent = FixedPolicyAgent.default(environment, policy=policy)
+    eval_agent.logger.change_log_dir(name)
+    evaluate_domain_shift(
+        env_args=env_args,
+        agent=eval_agent,
+        seed=args.seed,
+        num_runs=args.num_eval_runs,
+    )
+    eval_statistics = eval_agent.logger.statistics
 with open(f"{name}_eval.json", "w") as f:
-    json.dump(eval_agent.logger.statistics, f)
+    json.dump(eval_statistics, f)
@@ -0,0 +1,90 @@
+"""Benchmark cold and warm started adversarial MPC in inverted pendulum."""
+import argparse
+import time
+
+import numpy as np
+from rllib.model.transformed_model import TransformedModel
+from rllib.util.utilities import set_random_seed
+
+from applications.inverted_pendulum.utilities import PendulumModel
+from rhucrl.agent import AdversarialMPCAgent
+from rhucrl.environment.adversarial_environment import AdversarialEnv
+from rhucrl.environment.wrappers import AdversarialPendulumWrapper
+
+
+def init_experiment(args, warm_start):
+    """Initialize the agent and the environment of a benchmark run."""
+    set_random_seed(args.seed)
+    environment = AdversarialEnv(env_name="PendulumSwingUp-v0", seed=args.seed)
+    reward_model = environment.env.reward_model()
+    dynamical_model = TransformedModel(
+        PendulumModel(
+            alpha=args.alpha,
+            force_body_names=("mass", "gravity"),
+            wrapper="adversarial",
+        ),
+        transformations=[],
+    )
+    environment.add_wrapper(
+        AdversarialPendulumWrapper,
+        alpha=args.alpha,
+        force_body_names=("mass", "gravity"),
+    )
+
+    agent = AdversarialMPCAgent.default(
+        environment=environment,
+        reward_model=reward_model,
+        dynamical_model=dynamical_model,
+        horizon=args.horizon,
+        num_iter=args.num_iter,
+        warm_start=warm_start,
+        warm_start_num_iter=args.warm_start_num_iter if warm_start else None,
+        exploration_steps=0,
+        exploration_episodes=0,
+    )
+    agent.logger.delete_directory()
+    return agent, environment
+
+
+def run_episode(agent, environment, max_steps):
+    """Run an episode and return the episode return and the time of each action."""
+    agent.eval()
+    agent.policy.reset()
+    state = environment.reset()
+    episode_return, act_times = 0.0, []
+    for _ in range(max_steps):
+        start = time.perf_counter()
+        action = agent.act(state)
+        act_times.append(time.perf_counter() - start)
+        state, reward, done, _ = environment.step(action)
+        episode_return += reward
+        if done:
+            break
+    environment.close()
+    return episode_return, np.array(act_times)
+
+
+def main(args):
+    """Compare the return and the time per action of cold and warm start."""
+    for warm_start in [False, True]:
+        agent, environment = init_experiment(args, warm_start)
+        episode_return, act_times = run_episode(agent, environment, args.max_steps)
+        name = "warm" if warm_start else "cold"
+        print(
+            f"{name} start: return {episode_return:.2f} "
+            f"time per action {1000 * act_times.mean():.2f} "
+            f"+- {1000 * act_times.std():.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser("Benchmark warm started adversarial MPC.")
+    parser.add_argument("--alpha", default=0.1, type=float, help="Antagonist power.")
+    parser.add_argument("--horizon", default=40, type=int, help="MPC horizon.")
+    parser.add_argument("--num-iter", default=5, type=int, help="Cold start iter.")
+    parser.add_argument(
+        "--warm-start-num-iter", default=1, type=int, help="Warm start iter."
+    )
+    parser.add_argument("--max-steps", default=200, type=int, help="Episode length.")
+    parser.add_argument("--seed", type=int, default=0, help="Random Seed.")
+    main(parser.parse_args())
@@ -17,7 +17,15 @@ class ActionRobustAgent(AbstractAgent):
     """Action Robust Agent class."""
 
     @classmethod
-    def default(cls, environment, base_agent_name="SAC", kind="noisy", *args, **kwargs):
+    def default(
+        cls,
+        environment,
+        base_agent_name="SAC",
+        kind="noisy",
+        ensemble_reduction="first",
+        *args,
+        **kwargs,
+    ):
         """Initialize Action Robust agent."""
         if kind == "noisy":
             policy_ = NoisyActionRobustPolicy
@@ -37,6 +45,7 @@ class ActionRobustAgent(AbstractAgent):
         agent.algorithm.pathwise_loss = pathwise_loss_(
             critic=agent.algorithm.pathwise_loss.critic,
             policy=agent.algorithm.pathwise_loss.policy,
+            ensemble_reduction=ensemble_reduction,
         )
 
         return agent
@@ -94,7 +94,13 @@ class ActionRobustHUCRLAgent(ModelBasedAgent):
 
     @classmethod
     def default(
-        cls, environment, base_agent_name="BPTT", kind="noisy", *args, **kwargs
+        cls,
+        environment,
+        base_agent_name="BPTT",
+        kind="noisy",
+        ensemble_reduction="first",
+        *args,
+        **kwargs,
     ):
         """Initialize Action Robust agent."""
         if kind == "noisy":
@@ -115,6 +121,7 @@ class ActionRobustHUCRLAgent(ModelBasedAgent):
         agent.algorithm.pathwise_loss = pathwise_loss_(
             critic=agent.algorithm.pathwise_loss.critic,
             policy=agent.algorithm.pathwise_loss.policy,
+            ensemble_reduction=ensemble_reduction,
         )
         return super().default(
             environment=environment, base_agent=agent, *args, **kwargs
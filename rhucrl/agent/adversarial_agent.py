@@ -1,11 +1,12 @@
 """Python Script Template."""
-import time
 from abc import ABCMeta
 from copy import deepcopy
 
 import numpy as np
 from rllib.agent import AbstractAgent
-from rllib.util.logger import Logger
+
+from rhucrl.utilities.lazy_logger import LazyLogger
+from rhucrl.utilities.lazy_population import LazyPopulation
 
 
 class AdversarialAgent(AbstractAgent, metaclass=ABCMeta):
@@ -35,28 +36,46 @@ class AdversarialAgent(AbstractAgent, metaclass=ABCMeta):
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
-        self.protagonists = [deepcopy(protagonist_agent) for _ in range(n_protagonists)]
-        self.antagonists = [deepcopy(antagonist_agent) for _ in range(n_antagonists)]
-
-        self.agents = self.protagonists + self.antagonists
-
-        for role, agent_list in zip(
-            ["Protagonist", "Antagonist"], [self.protagonists, self.antagonists]
-        ):
-            for i, agent in enumerate(agent_list):
-                time.sleep(0.1)
-                try:
-                    agent.logger.delete_directory()
-                except (FileNotFoundError, AttributeError):
-                    pass
-                agent.logger = Logger(
-                    f"{self.logger.log_dir[5:]}/{role}-{i}-{agent.name}",
-                    tensorboard=False,
-                )
+        for agent in [protagonist_agent, antagonist_agent]:
+            try:
+                agent.logger.delete_directory()
+            except (FileNotFoundError, AttributeError):
+                pass
+
+        self.protagonists = LazyPopulation(
+            protagonist_agent,
+            size=n_protagonists,
+            factory=self._make_member,
+            name="Protagonist",
+        )
+        self.antagonists = LazyPopulation(
+            antagonist_agent,
+            size=n_antagonists,
+            factory=self._make_member,
+            name="Antagonist",
+        )
 
         self.protagonist_idx = 0
         self.antagonist_idx = 0
 
+    def _make_member(self, agent, name, copy=True):
+        """Make a member from an agent, copied without its logger, with a lazy logger.
+
+        The log directory of the member is unique and it is only created when the
+        member logs for the first time.
+        """
+        if copy:
+            agent = deepcopy(agent, memo={id(agent.logger): None})
+        agent.logger = LazyLogger(
+            f"{self.logger.log_dir[5:]}/{name}-{agent.name}", tensorboard=False
+        )
+        return agent
+
+    @property
+    def agents(self):
+        """Get the protagonists and antagonists that were materialized."""
+        return self.protagonists.materialized + self.antagonists.materialized
+
     @property
     def protagonist(self):
         """Get current protagonist."""
@@ -79,11 +98,24 @@ class AdversarialAgent(AbstractAgent, metaclass=ABCMeta):
             str_ += str(agent)
         return str_
 
-    def start_episode(self):
-        """Start episode of both players."""
+    def sample_players(self):
+        """Sample the indexes of the protagonist and the antagonist of an episode."""
+        return (
+            np.random.choice(len(self.protagonists)),
+            np.random.choice(len(self.antagonists)),
+        )
+
+    def set_players(self, players):
+        """Set the protagonist and the antagonist that play."""
+        self.protagonist_idx, self.antagonist_idx = players
+
+    def start_episode(self, players=None):
+        """Start episode of both players.
+
+        If players is None, the players of the episode are sampled.
+        """
         super().start_episode()
-        self.protagonist_idx = np.random.choice(len(self.protagonists))
-        self.antagonist_idx = np.random.choice(len(self.antagonists))
+        self.set_players(self.sample_players() if players is None else players)
 
         self.protagonist.start_episode()
         self.antagonist.start_episode()
@@ -102,8 +134,11 @@ class AdversarialAgent(AbstractAgent, metaclass=ABCMeta):
 
     def set_goal(self, goal):
         """Set the goal to both players."""
-        for agent in self.agents:
-            agent.set_goal(goal)
+        for population in [self.protagonists, self.antagonists]:
+            if not population.template_is_member:
+                population.template.set_goal(goal)
+            for agent in population.materialized:
+                agent.set_goal(goal)
 
     def train(self, val=True):
         """Set training mode.
@@ -146,11 +181,15 @@ class AdversarialAgent(AbstractAgent, metaclass=ABCMeta):
         self.policy.only_protagonist = val
 
     def save(self, filename, directory=None):
-        """Save both agents."""
+        """Save both agents.
+
+        Only the materialized members are saved, the others still have the initial
+        parameters of the template agent.
+        """
         for role, agent_list in zip(
             ["Protagonist", "Antagonist"], [self.protagonists, self.antagonists]
         ):
-            for i, agent in enumerate(agent_list):
+            for i, agent in sorted(agent_list.members.items()):
                 agent.save(f"{role}-{i}-{filename}", directory=directory)
 
     def load_protagonist(self, path, idx=0):
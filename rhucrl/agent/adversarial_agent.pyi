@@ -1,6 +1,6 @@
 """Python Script Template."""
 from abc import ABCMeta
-from typing import Any, List, Optional, Type, TypeVar
+from typing import Any, List, Optional, Tuple, Type, TypeVar
 
 from rllib.agent import AbstractAgent
 from rllib.dataset.datatypes import Observation
@@ -8,13 +8,13 @@ from rllib.model import AbstractModel
 from torch import Tensor
 
 from rhucrl.environment import AdversarialEnv
+from rhucrl.utilities.lazy_population import LazyPopulation
 
 T = TypeVar("T", bound="AdversarialAgent")
 
 class AdversarialAgent(AbstractAgent, metaclass=ABCMeta):
-    agents: List[AbstractAgent]
-    protagonists: List[AbstractAgent]
-    antagonists: List[AbstractAgent]
+    protagonists: LazyPopulation
+    antagonists: LazyPopulation
     protagonist_idx: int
     antagonist_idx: int
     def __init__(
@@ -26,6 +26,11 @@ class AdversarialAgent(AbstractAgent, metaclass=ABCMeta):
         *args: Any,
         **kwargs: Any,
     ) -> None: ...
+    def _make_member(
+        self, agent: AbstractAgent, name: str, copy: bool = ...
+    ) -> AbstractAgent: ...
+    @property
+    def agents(self) -> List[AbstractAgent]: ...
     @property
     def protagonist(self) -> AbstractAgent: ...
     @property
@@ -34,7 +39,9 @@ class AdversarialAgent(AbstractAgent, metaclass=ABCMeta):
         self, protagonist_observation: Observation, antagonist_observation: Observation
     ) -> None: ...
     def __str__(self) -> str: ...
-    def start_episode(self) -> None: ...
+    def sample_players(self) -> Tuple[int, ...]: ...
+    def set_players(self, players: Tuple[int, ...]) -> None: ...
+    def start_episode(self, players: Optional[Tuple[int, ...]] = ...) -> None: ...
     def end_episode(self) -> None: ...
     def end_interaction(self) -> None: ...
     def set_goal(self, goal: Optional[Tensor]) -> None: ...
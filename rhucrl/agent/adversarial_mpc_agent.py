@@ -1,5 +1,6 @@
 """Python Script Template."""
 import importlib
+import time
 
 import torch
 from rllib.agent import ModelBasedAgent, MPCAgent
@@ -16,6 +17,11 @@ class AdversarialMPCAgent(MPCAgent):
         protagonist_dim_action,
         antagonist_dim_action,
         nominal_model=False,
+        schedule="sequential",
+        warm_start=None,
+        warm_start_num_iter=None,
+        pad_action=None,
+        num_antagonist_iter=None,
         action_scale=None,
         *args,
         **kwargs,
@@ -26,12 +32,24 @@ class AdversarialMPCAgent(MPCAgent):
             protagonist_dim_action=protagonist_dim_action,
             antagonist_dim_action=antagonist_dim_action,
             nominal_model=nominal_model,
+            schedule=schedule,
+            warm_start=warm_start,
+            warm_start_num_iter=warm_start_num_iter,
+            pad_action=pad_action,
+            num_antagonist_iter=num_antagonist_iter,
         )
         if action_scale is None:
             action_scale = torch.ones(self.policy.dim_action)
         self.policy.action_scale = action_scale
         self.policy.solver.base_solver.action_scale = action_scale
 
+    def act(self, state):
+        """Ask the MPC policy for an action and log the wall-clock time it takes."""
+        start = time.perf_counter()
+        action = super().act(state)
+        self.logger.update(act_time=time.perf_counter() - start)
+        return action
+
     @classmethod
     def default(
         cls,
@@ -4,21 +4,32 @@ from importlib import import_module
 from rllib.agent import AbstractAgent
 
 from rhucrl.algorithm.maximin_algorithm import MaxiMinAlgorithm
-from rhucrl.policy.split_policy import SplitPolicy
+from rhucrl.policy.split_policy import FusedSplitPolicy, SplitPolicy
 
 
 class MaxiMinAgent(AbstractAgent):
     """Maximin Agent class."""
 
     @classmethod
-    def default(cls, environment, base_agent_name="BPTT", *args, **kwargs):
+    def default(
+        cls,
+        environment,
+        base_agent_name="BPTT",
+        fused_policy=False,
+        single_pass=False,
+        *args,
+        **kwargs,
+    ):
         """Initialize maximin by default."""
-        policy = SplitPolicy.default(
+        policy_class = FusedSplitPolicy if fused_policy else SplitPolicy
+        policy = policy_class.default(
             environment, hallucinate_protagonist=True, *args, **kwargs
         )
         agent_module = import_module("rllib.agent")
         base_agent = getattr(agent_module, f"{base_agent_name}Agent").default(
             environment, policy=policy, *args, **kwargs
         )
-        base_agent.algorithm = MaxiMinAlgorithm(base_agent.algorithm)
+        base_agent.algorithm = MaxiMinAlgorithm(
+            base_agent.algorithm, single_pass=single_pass
+        )
         return base_agent
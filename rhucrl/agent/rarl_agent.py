@@ -1,11 +1,13 @@
 """Python Script Template."""
+from copy import copy
 from importlib import import_module
 
+import numpy as np
 import torch
 from hucrl.environment.hallucination_wrapper import HallucinationWrapper
 from hucrl.policy.augmented_policy import AugmentedPolicy
+from rllib.agent.off_policy.off_policy_agent import OffPolicyAgent
 from rllib.policy import NNPolicy
-from rllib.util.utilities import tensor_to_distribution
 
 from rhucrl.agent.adversarial_agent import AdversarialAgent
 from rhucrl.environment.utilities import (
@@ -13,6 +15,8 @@ from rhucrl.environment.utilities import (
     adversarial_to_protagonist_environment,
 )
 from rhucrl.policy.joint_policy import JointPolicy
+from rhucrl.policy.population_policy import PopulationOptimizer, PopulationPolicy
+from rhucrl.utilities.role_memory import FakeHallucination, RoleMemoryView
 
 
 class RARLAgent(AdversarialAgent):
@@ -21,11 +25,19 @@ class RARLAgent(AdversarialAgent):
     RARL has two independent agents.
     The protagonist receives (s, a_pro, r, s') and the antagonist (s, a_ant, -r, s').
 
+    If shared_memory is True, the joint transitions are stored once in the memory of
+    the protagonist, and the memories of the players are replaced by role views of it.
+    This only works with agents that learn from a replay memory.
+
+    The fake hallucination of a hallucinating antagonist is sampled in batch when its
+    memory is sampled. Antagonists without a replay memory, e.g., on-policy agents,
+    receive their observations at the end of the episode, after the fake
+    hallucination of the whole trajectory is sampled in batch.
     """
 
     policy: JointPolicy
 
-    def __init__(self, dim_action, action_scale, *args, **kwargs):
+    def __init__(self, dim_action, action_scale, shared_memory=False, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.policy = JointPolicy(
             dim_state=self.protagonist.policy.dim_state,
@@ -34,6 +46,58 @@ class RARLAgent(AdversarialAgent):
             protagonist_policy=self.protagonist.policy,
             antagonist_policy=self.antagonist.policy,
         )
+        self.shared_memory = None
+        if shared_memory:
+            if not isinstance(self.protagonist, OffPolicyAgent):
+                raise NotImplementedError("Shared memory requires a replay memory.")
+            self.shared_memory = self.protagonist.memory
+        self._antagonist_observations = []
+        self._set_role_memories()
+
+    def _role_indexes(self):
+        """Get the indexes of the joint action of the protagonist and antagonist."""
+        p_dim = self.policy.protagonist_policy.dim_action[0]
+        a_dim = self.policy.antagonist_policy.dim_action[0]
+        dim_action = self.policy.dim_action[0]
+        p_indexes = list(range(p_dim)) + list(range(p_dim + a_dim, dim_action))
+        a_indexes = list(range(p_dim, p_dim + a_dim))
+        return p_indexes, a_indexes
+
+    def _fake_hallucination(self):
+        """Get the sampler of the fake hallucination of the antagonist, if any."""
+        if not isinstance(self.antagonist.policy, AugmentedPolicy):
+            return None
+        return FakeHallucination(
+            self.antagonist.policy, self.policy.antagonist_policy.dim_action[0]
+        )
+
+    def _set_role_memories(self):
+        """Replace the memories of the current players by role views.
+
+        With a shared memory, both players read views of it. Otherwise, the memory of a
+        hallucinating off-policy antagonist is wrapped by a view that owns it.
+        """
+        p_indexes, a_indexes = self._role_indexes()
+        if self.shared_memory is not None:
+            if not isinstance(self.protagonist.memory, RoleMemoryView):
+                self.protagonist.memory = RoleMemoryView(self.shared_memory, p_indexes)
+            if not isinstance(self.antagonist.memory, RoleMemoryView):
+                self.antagonist.memory = RoleMemoryView(
+                    self.shared_memory,
+                    a_indexes,
+                    reward_sign=-1.0,
+                    fake_hallucination=self._fake_hallucination(),
+                )
+        elif isinstance(self.antagonist, OffPolicyAgent) and not isinstance(
+            self.antagonist.memory, RoleMemoryView
+        ):
+            fake_hallucination = self._fake_hallucination()
+            if fake_hallucination is not None:
+                self.antagonist.memory = RoleMemoryView(
+                    self.antagonist.memory,
+                    fake_hallucination=fake_hallucination,
+                    owner=True,
+                )
 
     def observe(self, observation):
         """Send observations to both agents.
@@ -42,32 +106,59 @@ class RARLAgent(AdversarialAgent):
         Send to antagonist (s, a_a, -r, s', other).
         """
         super().observe(observation)
+        if self.shared_memory is not None:
+            self._observe_shared(observation)
+            return
         p_observation = observation.clone()
         a_observation = observation.clone()
 
-        fake_action = tensor_to_distribution(
-            self.antagonist.policy(p_observation.state)
-        ).sample()
+        p_indexes, a_indexes = self._role_indexes()
+        p_observation.action = observation.action[..., p_indexes]
+        a_observation.action = observation.action[..., a_indexes]
+        a_observation.reward = -observation.reward
+        if isinstance(self.antagonist.policy, AugmentedPolicy) and not isinstance(
+            getattr(self.antagonist, "memory", None), RoleMemoryView
+        ):
+            self.protagonist.observe(p_observation)
+            self._antagonist_observations.append(a_observation)
+        else:
+            self.send_observations(p_observation, a_observation)
+
+    def _flush_antagonist_observations(self):
+        """Sample the fake hallucination of the trajectory and send it to antagonist."""
+        if not self._antagonist_observations:
+            return
+        observations, self._antagonist_observations = self._antagonist_observations, []
+        fake_action = FakeHallucination(
+            self.antagonist.policy, self.policy.antagonist_policy.dim_action[0]
+        )(torch.stack([observation.state for observation in observations]))
+        for observation, fake in zip(observations, fake_action):
+            observation.action = torch.cat((observation.action, fake), -1)
+            self.antagonist.observe(observation)
 
-        p_dim = self.policy.protagonist_policy.dim_action[0]
-        a_dim = self.policy.antagonist_policy.dim_action[0]
+    def end_episode(self):
+        """Send the pending antagonist observations and end the episode."""
+        self._flush_antagonist_observations()
+        super().end_episode()
 
-        p_observation.action = torch.cat(
-            (observation.action[:p_dim], observation.action[p_dim + a_dim :]), -1
-        )
-        a_observation.action = torch.cat(
-            (observation.action[p_dim : p_dim + a_dim], fake_action[a_dim:]), -1
-        )
+    def _observe_shared(self, observation):
+        """Store the joint observation once and send shallow role copies to agents.
 
+        The role memories ignore the copies, they only update the agent counters. The
+        fake hallucination of the antagonist is sampled when its memory is sampled.
+        """
+        self.shared_memory.append(observation)
+        p_indexes, a_indexes = self._role_indexes()
+        p_observation, a_observation = copy(observation), copy(observation)
+        p_observation.action = observation.action[..., p_indexes]
+        a_observation.action = observation.action[..., a_indexes]
         a_observation.reward = -observation.reward
         self.send_observations(p_observation, a_observation)
 
-    def start_episode(self):
-        """Start a new episode.
-
-        Here a new protagonist and antagonist may be sampled, hence reset the policies.
-        """
-        super().start_episode()
+    def set_players(self, players):
+        """Set the players and reset the joint policy."""
+        super().set_players(players)
+        self._set_role_memories()
         self.policy.set_protagonist_policy(self.protagonist.policy)
         self.policy.set_antagonist_policy(self.antagonist.policy)
 
@@ -83,12 +174,21 @@ class RARLAgent(AdversarialAgent):
 
     @staticmethod
     def _init_agent(
-        environment, agent_class_, hallucinate, dynamical_model=None, *args, **kwargs
+        environment,
+        agent_class_,
+        hallucinate,
+        dynamical_model=None,
+        policy=None,
+        *args,
+        **kwargs,
     ):
         if dynamical_model is not None:
             dynamical_model = type(dynamical_model).default(environment)
 
-        if hallucinate:
+        if policy is not None:
+            if hallucinate:
+                raise NotImplementedError("Given policies can not hallucinate.")
+        elif hallucinate:
             policy = AugmentedPolicy.default(environment, *args, **kwargs)
             environment.add_wrapper(HallucinationWrapper)
         else:
@@ -106,6 +206,7 @@ class RARLAgent(AdversarialAgent):
         hallucinate_protagonist=False,
         hallucinate_antagonist=False,
         dynamical_model=None,
+        antagonist_policy=None,
         *args,
         **kwargs,
     ):
@@ -126,6 +227,7 @@ class RARLAgent(AdversarialAgent):
             environment=a_env,
             agent_class_=agent_,
             hallucinate=hallucinate_antagonist,
+            policy=antagonist_policy,
             *args,
             **kwargs,
         )
@@ -157,7 +259,67 @@ class HRARLAgent(RARLAgent):
 
 
 class RAPAgent(RARLAgent):
-    """RAP Agent."""
+    """RAP Agent.
+
+    If population is True, a single antagonist agent holds a `PopulationPolicy'
+    with `n_antagonists' members whose parameters are stored contiguously.
+    Each episode samples the member that acts and learns, instead of sampling one of
+    `n_antagonists' deep copies of the antagonist agent. The optimizer of the
+    antagonist is wrapped by a `PopulationOptimizer', hence only the sampled member
+    is updated and each member keeps its own optimizer state.
+
+    Population mode is opt-in because it changes the RAP semantics: the members share
+    the critic and the memory of the antagonist agent. Each member learns from the
+    transitions of all the members, and the critic evaluates the mixture of members.
+    """
 
-    def __init__(self, n_antagonists=5, *args, **kwargs):
-        super().__init__(n_protagonists=1, n_antagonists=n_antagonists, *args, **kwargs)
+    def __init__(self, n_antagonists=5, population=False, *args, **kwargs):
+        self.population = population
+        super().__init__(
+            n_protagonists=1,
+            n_antagonists=1 if population else n_antagonists,
+            *args,
+            **kwargs,
+        )
+        if population:
+            self.antagonist.optimizer = PopulationOptimizer(
+                self.antagonist.optimizer, self.antagonist.policy
+            )
+
+    def sample_players(self):
+        """Sample the players and, in population mode, the antagonist member."""
+        players = super().sample_players()
+        if self.population:
+            players += (int(np.random.choice(self.antagonist.policy.num_members)),)
+        return players
+
+    def set_players(self, players):
+        """Set the players and, in population mode, the antagonist member."""
+        super().set_players(players[:2])
+        if self.population:
+            self.antagonist.policy.member = players[2]
+
+    @classmethod
+    def default(
+        cls,
+        environment,
+        n_antagonists=5,
+        population=False,
+        *args,
+        **kwargs,
+    ):
+        """Initialize RAP by default."""
+        if population:
+            kwargs.update(
+                antagonist_policy=PopulationPolicy.default(
+                    adversarial_to_antagonist_environment(environment=environment),
+                    num_members=n_antagonists,
+                )
+            )
+        return super().default(
+            environment,
+            n_antagonists=n_antagonists,
+            population=population,
+            *args,
+            **kwargs,
+        )
@@ -3,21 +3,59 @@ from importlib import import_module
 
 import torch
 from rllib.agent import ModelBasedAgent
+from rllib.model import AbstractModel
 from rllib.util.neural_networks.utilities import deep_copy_module
 
 from rhucrl.algorithm.antagonist_algorithm import AntagonistAlgorithm
 from rhucrl.algorithm.maximin_algorithm import MaxiMinAlgorithm
-from rhucrl.policy.split_policy import SplitPolicy
+from rhucrl.model import HallucinatedModel, PredictionCache
+from rhucrl.policy.split_policy import FusedSplitPolicy, SplitPolicy
+from rhucrl.utilities.batch_recorder import BatchRecorder
 
 
-class RHUCRLAgent(ModelBasedAgent):
-    """RHUCRL Agent."""
+def _share_models(source, copy, target):
+    """Replace the models of `copy' by the ones of `source' everywhere in `target'.
+
+    `copy' is a deep copy of `source' and a submodule of `target'.
+    """
+    shared = {
+        id(copied): module
+        for module, copied in zip(source.modules(), copy.modules())
+        if isinstance(module, AbstractModel)
+    }
+    for module in list(target.modules()):
+        for name, child in list(module.named_children()):
+            if id(child) in shared:
+                setattr(module, name, shared[id(child)])
+
 
-    def __init__(self, base_agent, best_response=False, *args, **kwargs):
+class RHUCRLAgent(ModelBasedAgent):
+    """RHUCRL Agent.
+
+    With prediction_cache=True, the antagonist algorithm shares the models of the
+    protagonist algorithm, and both updates of a learning round use one
+    `PredictionCache'. The antagonist update replays the batches that the
+    protagonist update sampled, hence the predictions of the shared models on a
+    batch are computed once per round. Each update still sees uniformly sampled
+    batches, but the batches of both players are the same. The hit rate and the
+    time saved are logged every round.
+    """
+
+    def __init__(
+        self,
+        base_agent,
+        best_response=False,
+        single_pass=False,
+        prediction_cache=False,
+        *args,
+        **kwargs,
+    ):
         super().__init__(
             **{**base_agent.__dict__, **dict(base_agent.algorithm.named_modules())}
         )
-        self.algorithm = MaxiMinAlgorithm(base_algorithm=base_agent.algorithm)
+        self.algorithm = MaxiMinAlgorithm(
+            base_algorithm=base_agent.algorithm, single_pass=single_pass
+        )
         self.antagonist_algorithm = AntagonistAlgorithm(
             base_algorithm=deep_copy_module(base_agent.algorithm)
         )
@@ -60,8 +98,25 @@ class RHUCRLAgent(ModelBasedAgent):
             **self.optimizer.defaults,
         )
 
+        # Share model predictions between protagonist and antagonist updates.
+        if prediction_cache:
+            _share_models(
+                self.algorithm,
+                self.antagonist_algorithm.base_algorithm,
+                self.antagonist_algorithm,
+            )
+            self.prediction_cache = PredictionCache()
+            for module in self.algorithm.modules():
+                if isinstance(module, HallucinatedModel):
+                    module.prediction_cache = self.prediction_cache
+        else:
+            self.prediction_cache = None
+
     def learn(self):
         """Learn antagonist."""
+        if self.prediction_cache is not None:
+            self._learn_with_prediction_cache()
+            return
         # Learn Protagonist.
         super().learn()
         # Set protagonist policy parameters.
@@ -71,6 +126,27 @@ class RHUCRLAgent(ModelBasedAgent):
         # Learn Antagonist.
         self.learn_antagonist()
 
+    def _learn_with_prediction_cache(self):
+        """Learn protagonist and antagonist on the same batches."""
+        memory = self.memory
+        self.memory = BatchRecorder(memory, prediction_cache=self.prediction_cache)
+        try:
+            super().learn()
+        finally:
+            recorder, self.memory = self.memory, memory
+        recorder.replay = True
+        self.learn_antagonist(memory=recorder)
+
+        self.logger.update(**self.prediction_cache.statistics())
+        self.prediction_cache.reset()
+
+    def _learn_steps(self, closure):
+        """Take the gradient steps, using the prediction cache if there is one."""
+        if self.prediction_cache is None:
+            return super()._learn_steps(closure)
+        with self.prediction_cache:
+            return super()._learn_steps(closure)
+
     def learn_antagonist(self, memory=None):
         """Fit the antagonist algorithm."""
         #
@@ -93,9 +169,12 @@ class RHUCRLAgent(ModelBasedAgent):
         self._learn_steps(closure)
 
     @classmethod
-    def default(cls, environment, base_agent_name="BPTT", *args, **kwargs):
+    def default(
+        cls, environment, base_agent_name="BPTT", fused_policy=False, *args, **kwargs
+    ):
         """See `AbstractAgent.default' method."""
-        policy = SplitPolicy.default(
+        policy_class = FusedSplitPolicy if fused_policy else SplitPolicy
+        policy = policy_class.default(
             environment, hallucinate_protagonist=True, *args, **kwargs
         )
         agent_module = import_module("rllib.agent")
@@ -13,49 +13,86 @@ from rhucrl.policy.action_robust_policy import (
     NoisyActionRobustPolicy,
     ProbabilisticActionRobustPolicy,
 )
+from rhucrl.policy.utilities import get_diagonal_scale
 
 
 class ActionRobustPathwiseLoss(PathwiseLoss, metaclass=ABCMeta):
-    """Pathwise Loss for Action Robust RL."""
+    """Pathwise Loss for Action Robust RL.
+
+    Parameters
+    ----------
+    diagonal_scale: bool, optional (default=False).
+        If True, the member policies are assumed to be diagonal normal distributions
+        and the actions are sampled as mean + std * noise, without building a
+        multivariate normal distribution from the scale_tril.
+        Policies that already return a diagonal std always use this path.
+    ensemble_reduction: str, optional (default="first").
+        Reduction of the heads of an ensemble critic. One of "first", "mean", "min".
+    """
 
     policy: ActionRobustPolicy
 
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self, diagonal_scale=False, ensemble_reduction="first", *args, **kwargs
+    ):
         super().__init__(*args, **kwargs)
+        if ensemble_reduction not in ["first", "mean", "min"]:
+            raise NotImplementedError(f"{ensemble_reduction} reduction not allowed.")
         self.alpha = self.policy.alpha
-
-    @staticmethod
-    def _get_action(policy, state):
-        pi = tensor_to_distribution(policy(state), **policy.dist_params)
-        return policy.action_scale * pi.rsample().clamp(-1, 1)
-
-    def _add_hallucination_action(self, state, protagonist_action, antagonist_action):
+        self.diagonal_scale = diagonal_scale
+        self.ensemble_reduction = ensemble_reduction
+
+    def _get_action(self, policy, state):
+        mean, scale = policy(state)
+        if self.diagonal_scale or scale.shape == mean.shape:
+            std = get_diagonal_scale(mean, scale)
+            action = mean + std * torch.randn_like(mean)
+            if policy.dist_params.get("tanh", False):
+                action = torch.tanh(action)
+        else:
+            pi = tensor_to_distribution((mean, scale), **policy.dist_params)
+            action = pi.rsample()
+        return policy.action_scale * action.clamp(-1, 1)
+
+    def _stack_actions(self, state, protagonist_action, antagonist_action):
+        """Stack the actions of both players, with the hallucination action.
+
+        The hallucination action is only differentiable in the slice of the player
+        that hallucinates.
+
+        Returns
+        -------
+        action: Tensor.
+            Critic actions with shape [2, *batch_shape, dim_action]. The first entry
+            is the protagonist action and the second the antagonist action.
+        """
         hallucination_action = self._get_action(self.policy.hallucination_policy, state)
-
         if self.policy.hallucinate_protagonist:
-            protagonist_action = torch.cat(
-                (protagonist_action, hallucination_action), dim=-1
-            )
-            antagonist_action = torch.cat(
-                (antagonist_action, hallucination_action.detach()), dim=-1
-            )
+            hallucination_action = (hallucination_action, hallucination_action.detach())
         else:
-            protagonist_action = torch.cat(
-                (protagonist_action, hallucination_action.detach()), dim=-1
-            )
-            antagonist_action = torch.cat(
-                (antagonist_action, hallucination_action), dim=-1
-            )
-        return (
-            protagonist_action[..., : self.critic.dim_action[0]],
-            antagonist_action[..., : self.critic.dim_action[0]],
+            hallucination_action = (hallucination_action.detach(), hallucination_action)
+
+        action = torch.cat(
+            (
+                torch.stack((protagonist_action, antagonist_action)),
+                torch.stack(hallucination_action),
+            ),
+            dim=-1,
         )
+        return action[..., : self.critic.dim_action[0]]
 
     def _loss(self, state, action):
+        """Compute the losses of the stacked actions with a single critic call."""
+        state = state.unsqueeze(0).expand(action.shape[0], *state.shape)
         with DisableGradient(self.critic):
             q = self.critic(state, action)
             if isinstance(self.critic, NNEnsembleQFunction):
-                q = q[..., 0]
+                if self.ensemble_reduction == "first":
+                    q = q[..., 0]
+                elif self.ensemble_reduction == "mean":
+                    q = q.mean(-1)
+                else:
+                    q = q.min(-1)[0]
         return -q
 
     def forward(self, observation):
@@ -82,14 +119,12 @@ class NoisyActionRobustPathwiseLoss(ActionRobustPathwiseLoss):
         antagonist_action = (
             1 - self.alpha
         ) * protagonist_action_.detach() + self.alpha * antagonist_action_
-        protagonist_action, antagonist_action = self._add_hallucination_action(
+        action = self._stack_actions(
             state=state,
             protagonist_action=protagonist_action,
             antagonist_action=antagonist_action,
         )
-
-        protagonist_loss = self._loss(state, protagonist_action)
-        antagonist_loss = self._loss(state, antagonist_action)
+        protagonist_loss, antagonist_loss = self._loss(state, action)
 
         return Loss(policy_loss=protagonist_loss - antagonist_loss)
 
@@ -108,12 +143,13 @@ class ProbabilisticActionRobustPathwiseLoss(ActionRobustPathwiseLoss):
         protagonist_action = self._get_action(self.policy.protagonist_policy, state)
         antagonist_action = self._get_action(self.policy.antagonist_policy, state)
 
-        protagonist_action, antagonist_action = self._add_hallucination_action(
+        action = self._stack_actions(
             state=state,
             protagonist_action=protagonist_action,
             antagonist_action=antagonist_action,
         )
+        protagonist_loss, antagonist_loss = self._loss(state, action)
 
-        protagonist_loss = (1 - self.alpha) * self._loss(state, protagonist_action)
-        antagonist_loss = self.alpha * self._loss(state, antagonist_action)
+        protagonist_loss = (1 - self.alpha) * protagonist_loss
+        antagonist_loss = self.alpha * antagonist_loss
         return Loss(policy_loss=protagonist_loss - antagonist_loss)
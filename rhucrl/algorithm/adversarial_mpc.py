@@ -1,6 +1,6 @@
 """Python Script Template."""
 from contextlib import nullcontext
-from typing import Any, Tuple
+from typing import Any, Optional, Tuple
 
 import torch
 import torch.nn as nn
@@ -25,6 +25,39 @@ class AdversarialMPCShooting(nn.Module):  # type: ignore
     nominal_model: bool, optional (default=False).
         If True, the protagonist will plan with the nominal model, ie alpha=0.
         If False, the protagonist will know how the antagonist affects the system.
+    schedule: str, optional (default="sequential").
+        If "sequential", the max_{protagonist} min_{antagonist} max_{hallucination}
+        problem is solved first and then the min_{antagonist} min_{hallucination}
+        problem is solved with the protagonist plan fixed.
+        If "concurrent", both problems are stacked along a new batch dimension and
+        share a single model rollout per iteration. The min problem then uses the
+        current protagonist plan of each iteration instead of the final one.
+        With a nominal model the two problems use different models, hence the
+        sequential schedule is always used.
+    warm_start: bool, optional (default=None).
+        If True, the base solver shifts the plan of the previous step by one step and
+        uses it as initial plan. If None, the warm start of the base solver is kept.
+    warm_start_num_iter: int, optional (default=None).
+        Number of iterations of each problem when the plan is warm started.
+        If None, num_iter iterations are used. It must be at least 1.
+    pad_action: str, optional (default=None).
+        Last action of a warm started plan, i.e., the `default_action' of the base
+        solver. If "zero", it is zero. If "constant", the last action of the previous
+        plan is repeated. If None, the default action of the base solver is kept.
+    num_antagonist_iter: int, optional (default=None).
+        Number of iterations of the min_{antagonist} min_{hallucination} problem of
+        the sequential schedule. If None, num_iter iterations are used.
+        If 0, the problem is not solved with new rollouts. Instead, the antagonist and
+        hallucination plans are the mean of the elites that minimize the returns in
+        the last iteration of the max-min-max problem. This is a joint elite
+        selection that halves the planning cost at the price of a less accurate
+        antagonist plan.
+
+    Notes
+    -----
+    The state may have arbitrary batch dimensions, e.g., one state per environment of a
+    vectorized environment or per evaluation seed. All of them are solved in the same
+    tensor operations.
     """
 
     def __init__(
@@ -33,6 +66,11 @@ class AdversarialMPCShooting(nn.Module):  # type: ignore
         protagonist_dim_action: Tuple[int],
         antagonist_dim_action: Tuple[int],
         nominal_model: bool = False,
+        schedule: str = "sequential",
+        warm_start: Optional[bool] = None,
+        warm_start_num_iter: Optional[int] = None,
+        pad_action: Optional[str] = None,
+        num_antagonist_iter: Optional[int] = None,
     ) -> None:
         super().__init__()
         self.base_solver = base_solver
@@ -43,6 +81,21 @@ class AdversarialMPCShooting(nn.Module):  # type: ignore
         else:
             self.h_dim_action = (0,)
         self.nominal_model = nominal_model
+        if schedule not in ["sequential", "concurrent"]:
+            raise ValueError(f"{schedule} schedule not implemented.")
+        self.schedule = schedule
+        if warm_start is not None:
+            self.base_solver.warm_start = warm_start
+        if pad_action is not None:
+            if pad_action not in ["zero", "constant"]:
+                raise ValueError(f"{pad_action} pad action not implemented.")
+            self.base_solver.default_action = pad_action
+        if warm_start_num_iter is not None and warm_start_num_iter < 1:
+            raise ValueError(
+                f"warm_start_num_iter must be at least 1, got {warm_start_num_iter}."
+            )
+        self.warm_start_num_iter = warm_start_num_iter
+        self.num_antagonist_iter = num_antagonist_iter
 
         self.dim_action = (
             self.p_dim_action[0] + self.a_dim_action[0] + self.h_dim_action[0]
@@ -58,44 +111,88 @@ class AdversarialMPCShooting(nn.Module):  # type: ignore
         except AttributeError:
             return getattr(self.base_solver, name)
 
+    def split_actions(self, actions):
+        """Split actions into protagonist, antagonist, and hallucination actions."""
+        return actions.split(
+            [self.p_dim_action[0], self.a_dim_action[0], self.h_dim_action[0]], -1
+        )
+
+    def get_max_min_elites(self, action_sequence, returns):
+        """Get elites that maximize for protagonist/hallucination and min antagonist."""
+        max_actions = self.get_best_action(action_sequence, returns)
+        min_actions = self.get_best_action(action_sequence, -returns)
+
+        # Be optimistic about the model by maximizing h_action.
+        p_action, _, h_action = self.split_actions(max_actions)
+        _, a_action, _ = self.split_actions(min_actions)
+
+        return torch.cat([p_action, a_action, h_action], dim=-1)
+
+    def initialize_actions(self, batch_shape):
+        """Initialize the plan with the base solver and return True if warm started.
+
+        The plan of the previous step is discarded if its batch shape differs.
+        """
+        previous_mean = self.base_solver.mean
+        if previous_mean is not None and previous_mean.shape[1:-1] != batch_shape:
+            self.base_solver.mean = None
+        warm_started = self.base_solver.warm_start and self.base_solver.mean is not None
+        self.base_solver.initialize_actions(batch_shape)
+        return warm_started
+
     def forward(self, state):
         """Return action that solves the MPC problem."""
         self.dynamical_model.eval()
         batch_shape = state.shape[:-1]
-        self.initialize_actions(batch_shape)
+        warm_started = self.initialize_actions(batch_shape)
+        if warm_started and self.warm_start_num_iter is not None:
+            num_iter = self.warm_start_num_iter
+        else:
+            num_iter = self.num_iter
 
         state = repeat_along_dimension(state, number=self.num_samples, dim=-2)
+        if self.schedule == "concurrent" and not self.nominal_model:
+            self._solve_concurrent(state, batch_shape, num_iter)
+        else:
+            self._solve_sequential(state, num_iter)
+
+        if self.clamp:
+            return self.mean.clamp(-1.0, 1.0)
+        return self.mean
 
+    def _solve_sequential(self, state, num_iter):
+        """Solve the max-min-max problem and then the min-min problem."""
         if self.nominal_model:
             cm = NominalModel(model=self.dynamical_model.base_model)
         else:
             cm = nullcontext()
+        if self.num_antagonist_iter is None:
+            num_antagonist_iter = num_iter
+        else:
+            num_antagonist_iter = min(self.num_antagonist_iter, num_iter)
+
         # max_{protagonist} min_{antagonist} max_{hallucination}
-        for _ in range(self.num_iter):
+        for _ in range(num_iter):
             action_sequence = self.get_candidate_action_sequence()
             with cm:  # Evaluate possibly with nominal model.
                 returns = self.evaluate_action_sequence(action_sequence, state)
 
-            max_actions = self.get_best_action(action_sequence, returns)
-            min_actions = self.get_best_action(action_sequence, -returns)
-
-            # Be optimistic about the model by maximizing h_action.
-            p_action, _, h_action = max_actions.split(
-                [self.p_dim_action[0], self.a_dim_action[0], self.h_dim_action[0]], -1
-            )
-            _, a_action, _ = min_actions.split(
-                [self.p_dim_action[0], self.a_dim_action[0], self.h_dim_action[0]], -1
-            )
-
-            elite_actions = torch.cat([p_action, a_action, h_action], dim=-1)
-
+            elite_actions = self.get_max_min_elites(action_sequence, returns)
             self.update_sequence_generation(elite_actions)
 
+        if num_antagonist_iter == 0 and not self.nominal_model:
+            # Joint elite selection: reuse the rollouts of the last iteration.
+            min_actions = self.get_best_action(action_sequence, -returns).mean(-2)
+            mean = self.mean.clone()
+            mean[..., self.p_dim_action[0] :] = min_actions[..., self.p_dim_action[0] :]
+            self.base_solver.mean = mean
+            return
+
         p_action = repeat_along_dimension(
             self.mean[..., : self.p_dim_action[0]], number=self.num_samples, dim=-2
         )
         # min_{antagonist} min_{hallucination}
-        for _ in range(self.num_iter):
+        for _ in range(num_antagonist_iter):
             action_sequence = self.get_candidate_action_sequence()
 
             # Fix protagonists actions.
@@ -105,9 +202,39 @@ class AdversarialMPCShooting(nn.Module):  # type: ignore
             elite_actions = self.get_best_action(action_sequence, -returns)
             self.update_sequence_generation(elite_actions)
 
-        if self.clamp:
-            return self.mean.clamp(-1.0, 1.0)
-        return self.mean
+    def _solve_concurrent(self, state, batch_shape, num_iter):
+        """Solve both problems stacked along a new leading batch dimension.
+
+        Index 0 of the new dimension is the max-min-max problem and index 1 is the
+        min-min problem, whose protagonist actions are fixed to the plan of index 0.
+        """
+        p_dim = self.p_dim_action[0]
+        mean = self.mean
+        self.base_solver.mean = None
+        self.base_solver.initialize_actions((2,) + batch_shape)
+        self.base_solver.mean = torch.stack((mean, mean), dim=1)
+
+        state = torch.stack((state, state))
+        for _ in range(num_iter):
+            action_sequence = self.get_candidate_action_sequence()
+
+            # Fix protagonists actions of the min problem.
+            p_action = self.mean[:, 0, ..., :p_dim].unsqueeze(-2)
+            action_sequence[:, 1, ..., :p_dim] = p_action
+
+            returns = self.evaluate_action_sequence(action_sequence, state)
+
+            max_elites = self.get_max_min_elites(action_sequence[:, 0], returns[0])
+            min_elites = self.get_best_action(action_sequence[:, 1], -returns[1])
+            self.update_sequence_generation(torch.stack((max_elites, min_elites), 1))
+
+        mean = self.mean[:, 1].clone()
+        mean[..., :p_dim] = self.mean[:, 0, ..., :p_dim]
+
+        # Restore the mean and covariance to the shape of the state batch.
+        self.base_solver.mean = None
+        self.base_solver.initialize_actions(batch_shape)
+        self.base_solver.mean = mean
 
 
 class NominalModel(object):
@@ -1,8 +1,10 @@
 """Python Script Template."""
 from rllib.algorithms.derived_algorithm import DerivedAlgorithm
+from rllib.dataset.datatypes import Loss
 
 from rhucrl.policy.adversarial_policy import AdversarialPolicy
-from rhucrl.policy.utilities import AntagonistMode, ProtagonistMode
+from rhucrl.policy.split_policy import SplitPolicy
+from rhucrl.policy.utilities import AntagonistMode, MaxiMinMode, ProtagonistMode
 
 
 class MaxiMinAlgorithm(DerivedAlgorithm):
@@ -10,10 +12,29 @@ class MaxiMinAlgorithm(DerivedAlgorithm):
 
     It optimizes the loss for the base algorithm using the protagonist mode.
     It then uses the -actor loss for the antagonist.
+
+    Parameters
+    ----------
+    base_algorithm: AbstractAlgorithm.
+        Base algorithm.
+    single_pass: bool, optional (default=False).
+        If True, the base algorithm is evaluated once in maxi-min mode, so both roles
+        share the imagined trajectories, critic evaluations, and targets. The policy
+        does not detach any output and reverses the gradient of the antagonist
+        outputs, hence the gradient through the critic, the reward model, and the
+        dynamical model, e.g., of BPTT, is negated for the antagonist. The critic loss
+        is counted twice to keep its weight.
+        Unlike the two-pass scheme, the gradient of any other loss term that depends
+        on the antagonist outputs, e.g., a separate policy regularization, is also
+        negated for the antagonist. The policy must be a `SplitPolicy'.
     """
 
     policy: AdversarialPolicy
 
+    def __init__(self, base_algorithm, single_pass=False, *args, **kwargs):
+        super().__init__(base_algorithm=base_algorithm, *args, **kwargs)
+        self.single_pass = single_pass
+
     def set_protagonist_policy(self, new_policy):
         """Set protagonist policy."""
         self.policy.set_protagonist_policy(new_policy)
@@ -33,6 +54,9 @@ class MaxiMinAlgorithm(DerivedAlgorithm):
         """
         self.base_algorithm.reset_info()
 
+        if self.single_pass:
+            return self._single_pass_forward(observation)
+
         with ProtagonistMode(self.policy):
             protagonist_loss = self.base_algorithm(observation)
         with AntagonistMode(self.policy):
@@ -40,3 +64,11 @@ class MaxiMinAlgorithm(DerivedAlgorithm):
             antagonist_loss.policy_loss = -antagonist_loss.policy_loss
 
         return protagonist_loss + antagonist_loss
+
+    def _single_pass_forward(self, observation):
+        """Compute the protagonist and antagonist losses with one base forward."""
+        if not isinstance(self.policy, SplitPolicy):
+            raise NotImplementedError("Single pass requires a SplitPolicy.")
+        with MaxiMinMode(self.policy):
+            loss = self.base_algorithm(observation)
+        return loss + Loss(critic_loss=loss.critic_loss)
@@ -7,6 +7,11 @@ from .pendulum_wrapper import AdversarialPendulumWrapper
 from .probabilistic_action_robust_wrapper import ProbabilisticActionRobustWrapper
 from .reset_wrapper import ResetWrapper
 from .reward_wrapper import RewardWrapper
+from .vectorized_action_robust_wrapper import (
+    VectorizedNoisyActionRobustWrapper,
+    VectorizedProbabilisticActionRobustWrapper,
+)
+from .vectorized_adversarial_wrapper import VectorizedAdversarialWrapper
 
 try:
     from .mujoco_adversarial_wrapper import MujocoAdversarialWrapper
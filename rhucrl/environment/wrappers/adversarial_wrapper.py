@@ -6,7 +6,41 @@ from gym import Wrapper
 from gym.spaces import Box
 
 
-class AdversarialWrapper(Wrapper, metaclass=ABCMeta):
+class ActionValidationMixin(object):
+    """Mixin that sets how the actions of a wrapper are validated at each step."""
+
+    def set_validation(self, validation="full", frequency=1000, clip_actions=False):
+        """Set how the actions are validated at each step.
+
+        Parameters
+        ----------
+        validation: str, optional (default="full").
+            If "full", every action is checked to be in the action space.
+            If "sampled", one every `frequency' actions is checked.
+            If "off", the actions are not checked.
+        frequency: int, optional (default=1000).
+            Number of steps between checks when validation is "sampled".
+        clip_actions: bool, optional (default=False).
+            If True, the actions are clipped to the action space before the check.
+        """
+        if validation not in ["full", "sampled", "off"]:
+            raise NotImplementedError(f"{validation} validation not implemented.")
+        if frequency < 1:
+            raise ValueError(f"frequency must be positive and {frequency} was given.")
+        self.validation = validation
+        self.validation_frequency = frequency
+        self.clip_actions = clip_actions
+        self.num_steps = 0
+        self.validate_step = validation != "off"
+
+    def _advance_validation(self):
+        """Count a step and set whether its actions are validated."""
+        if self.validation == "sampled":
+            self.validate_step = self.num_steps % self.validation_frequency == 0
+        self.num_steps += 1
+
+
+class AdversarialWrapper(ActionValidationMixin, Wrapper, metaclass=ABCMeta):
     r"""An adversarial environment wrapper.
 
     This is an abstract wrapper that wraps a gym Env.
@@ -18,6 +52,7 @@ class AdversarialWrapper(Wrapper, metaclass=ABCMeta):
     If the action has other dimensions, then the adversarial_step() method is called.
     AdversarialWrapper leaves this method abstract.
 
+    The actions are validated according to `validation', see `set_validation()'.
     """
 
     def __init__(self, env, antagonist_low, antagonist_high, alpha=1.0):
@@ -33,6 +68,15 @@ class AdversarialWrapper(Wrapper, metaclass=ABCMeta):
         self.antagonist_low = antagonist_low
         self.antagonist_high = antagonist_high
         self.alpha = alpha
+        self.set_validation()
+
+    def _check_action(self, action, action_space):
+        """Clip and validate the action of a step."""
+        if self.clip_actions:
+            action = np.clip(action, action_space.low, action_space.high)
+        if self.validate_step:
+            assert action_space.contains(action), f"{action} invalid"
+        return action
 
     @property
     def alpha(self):
@@ -62,11 +106,13 @@ class AdversarialWrapper(Wrapper, metaclass=ABCMeta):
 
     def step(self, action):
         """See `gym.Env.step()'."""
+        self._advance_validation()
+
         if len(action) == self.protagonist_dim_action[0]:
-            assert self.env.action_space.contains(action), f"{action} invalid"
+            action = self._check_action(action, self.env.action_space)
             observation, reward, done, info = self.env.step(action)
         else:
-            assert self.action_space.contains(action), f"{action} invalid"
+            action = self._check_action(action, self.action_space)
 
             protagonist_action = action[: self.protagonist_dim_action[0]]
             antagonist_action = action[self.protagonist_dim_action[0] :]
@@ -4,8 +4,20 @@ from typing import Tuple
 
 import numpy as np
 from gym import Env, Wrapper
+from gym.spaces import Box
 
-class AdversarialWrapper(Wrapper, metaclass=ABCMeta):
+class ActionValidationMixin(object):
+    validation: str
+    validation_frequency: int
+    clip_actions: bool
+    num_steps: int
+    validate_step: bool
+    def set_validation(
+        self, validation: str = ..., frequency: int = ..., clip_actions: bool = ...
+    ) -> None: ...
+    def _advance_validation(self) -> None: ...
+
+class AdversarialWrapper(ActionValidationMixin, Wrapper, metaclass=ABCMeta):
     antagonist_low: np.ndarray
     antagonist_high: np.ndarray
     protagonist_dim_action: Tuple[int]
@@ -17,6 +29,7 @@ class AdversarialWrapper(Wrapper, metaclass=ABCMeta):
         antagonist_high: np.ndarray,
         alpha: float = 1.0,
     ) -> None: ...
+    def _check_action(self, action: np.ndarray, action_space: Box) -> np.ndarray: ...
     @property
     def alpha(self) -> float: ...
     @alpha.setter
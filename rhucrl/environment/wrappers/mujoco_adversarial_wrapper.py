@@ -14,6 +14,11 @@ class MujocoAdversarialWrapper(AdversarialWrapper):
         self.force_body_names = {
             name: env.model.body_names.index(name) for name in force_body_names
         }
+        # Indexes of the bodies and buffer of their (force, torque) in xfrc_applied.
+        self._force_body_indexes = np.array(
+            list(self.force_body_names.values()), dtype=np.int64
+        )
+        self._xfrc = np.zeros((len(self.force_body_names), 6))
 
         antagonist_high = np.ones(2 * len(self.force_body_names))
         antagonist_low = -antagonist_high
@@ -26,11 +31,10 @@ class MujocoAdversarialWrapper(AdversarialWrapper):
         )
 
     def _antagonist_action_to_xfrc(self, antagonist_action):
-        aa = self.alpha * antagonist_action
-        for i, body_index in enumerate(self.force_body_names.values()):
-            self.sim.data.xfrc_applied[body_index] = np.array(
-                [aa[i * 2], 0.0, aa[i * 2 + 1], 0.0, 0.0, 0.0]
-            )
+        """Apply the antagonist forces in the x-z plane of each body with a scatter."""
+        np.multiply(self.alpha, antagonist_action[0::2], out=self._xfrc[:, 0])
+        np.multiply(self.alpha, antagonist_action[1::2], out=self._xfrc[:, 2])
+        self.sim.data.xfrc_applied[self._force_body_indexes] = self._xfrc
 
     def adversarial_step(self, protagonist_action, antagonist_action):
         """See `AdversarialWrapper.adversarial_step()'."""
@@ -9,10 +9,13 @@ from .adversarial_wrapper import AdversarialWrapper
 
 try:
     from gym.envs.mujoco import MujocoEnv
+
     class MujocoAdversarialWrapper(AdversarialWrapper):
         """Wrapper for Mujoco adversarial environments."""
 
         force_body_names: Dict[str, int]
+        _force_body_indexes: np.ndarray
+        _xfrc: np.ndarray
         def __init__(
             self,
             env: MujocoEnv,
@@ -49,12 +49,13 @@ class NoisyActionRobustWrapper(AdversarialWrapper):
         self, protagonist_action: np.ndarray, antagonist_action: np.ndarray
     ) -> Tuple[np.ndarray, float, bool, dict]:
         """See `gym.Env.step()'."""
-        assert (
-            len(protagonist_action) == self.protagonist_dim_action[0]
-        ), "Protagonist action has wrong dimensions."
-        assert (
-            len(antagonist_action) == self.protagonist_dim_action[0]
-        ), "Adversarial action has wrong dimensions."
+        if self.validate_step:
+            assert (
+                len(protagonist_action) == self.protagonist_dim_action[0]
+            ), "Protagonist action has wrong dimensions."
+            assert (
+                len(antagonist_action) == self.protagonist_dim_action[0]
+            ), "Adversarial action has wrong dimensions."
 
         # Choose action by averaging protagonist and antagonist actions.
         action = (1 - self.alpha) * protagonist_action + self.alpha * antagonist_action
@@ -46,12 +46,13 @@ class ProbabilisticActionRobustWrapper(AdversarialWrapper):
 
     def adversarial_step(self, protagonist_action, antagonist_action):
         """See `gym.Env.step()'."""
-        assert (
-            len(protagonist_action) == self.protagonist_dim_action[0]
-        ), "Protagonist action has wrong dimensions."
-        assert (
-            len(antagonist_action) == self.protagonist_dim_action[0]
-        ), "Antagonist action has wrong dimensions."
+        if self.validate_step:
+            assert (
+                len(protagonist_action) == self.protagonist_dim_action[0]
+            ), "Protagonist action has wrong dimensions."
+            assert (
+                len(antagonist_action) == self.protagonist_dim_action[0]
+            ), "Antagonist action has wrong dimensions."
 
         # Choose action at random.
         if np.random.rand() < self.alpha:
@@ -0,0 +1,62 @@
+"""Vectorized counterparts of the Action Robust Wrappers."""
+
+import numpy as np
+
+from .noisy_action_robust_wrapper import NoisyActionRobustWrapper
+from .probabilistic_action_robust_wrapper import ProbabilisticActionRobustWrapper
+from .vectorized_adversarial_wrapper import VectorizedAdversarialWrapper
+
+
+class VectorizedNoisyActionRobustWrapper(VectorizedAdversarialWrapper):
+    r"""Step N noisy action robust environments with a batch of actions.
+
+    The actions of all environments are mixed with a single array operation:
+
+    ..math:: a = (1 - \alpha) a_p + \alpha a_a.
+
+    Parameters
+    ----------
+    envs: List[NoisyActionRobustWrapper].
+        List of noisy action robust environments.
+    """
+
+    def __init__(self, envs):
+        if not all(isinstance(env, NoisyActionRobustWrapper) for env in envs):
+            raise TypeError("Only noisy action robust wrappers can be vectorized.")
+        super().__init__(envs)
+
+    def adversarial_step(self, protagonist_actions, antagonist_actions):
+        """Mix the actions of all environments and step each environment."""
+        actions = (
+            1 - self.alpha
+        ) * protagonist_actions + self.alpha * antagonist_actions
+        return [env.env.step(action) for env, action in zip(self.envs, actions)]
+
+
+class VectorizedProbabilisticActionRobustWrapper(VectorizedAdversarialWrapper):
+    r"""Step N probabilistic action robust environments with a batch of actions.
+
+    The players of all environments are drawn with a single call to the random number
+    generator, and environment i executes
+
+    ..math:: a_i = a_{a, i}, with probability = \alpha
+    ..math:: a_i = a_{p, i}, with probability = (1-\alpha).
+
+    Parameters
+    ----------
+    envs: List[ProbabilisticActionRobustWrapper].
+        List of probabilistic action robust environments.
+    """
+
+    def __init__(self, envs):
+        if not all(isinstance(env, ProbabilisticActionRobustWrapper) for env in envs):
+            raise TypeError(
+                "Only probabilistic action robust wrappers can be vectorized."
+            )
+        super().__init__(envs)
+
+    def adversarial_step(self, protagonist_actions, antagonist_actions):
+        """Choose the player of each environment and step each environment."""
+        antagonist = np.random.rand(self.num_envs, 1) < self.alpha
+        actions = np.where(antagonist, antagonist_actions, protagonist_actions)
+        return [env.env.step(action) for env, action in zip(self.envs, actions)]
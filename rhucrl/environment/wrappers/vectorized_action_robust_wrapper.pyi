@@ -0,0 +1,22 @@
+"""Vectorized counterparts of the Action Robust Wrappers."""
+from typing import List, Tuple
+
+import numpy as np
+
+from .noisy_action_robust_wrapper import NoisyActionRobustWrapper
+from .probabilistic_action_robust_wrapper import ProbabilisticActionRobustWrapper
+from .vectorized_adversarial_wrapper import VectorizedAdversarialWrapper
+
+class VectorizedNoisyActionRobustWrapper(VectorizedAdversarialWrapper):
+    envs: List[NoisyActionRobustWrapper]
+    def __init__(self, envs: List[NoisyActionRobustWrapper]) -> None: ...
+    def adversarial_step(
+        self, protagonist_actions: np.ndarray, antagonist_actions: np.ndarray
+    ) -> List[Tuple[np.ndarray, float, bool, dict]]: ...
+
+class VectorizedProbabilisticActionRobustWrapper(VectorizedAdversarialWrapper):
+    envs: List[ProbabilisticActionRobustWrapper]
+    def __init__(self, envs: List[ProbabilisticActionRobustWrapper]) -> None: ...
+    def adversarial_step(
+        self, protagonist_actions: np.ndarray, antagonist_actions: np.ndarray
+    ) -> List[Tuple[np.ndarray, float, bool, dict]]: ...
@@ -0,0 +1,198 @@
+"""Vectorized counterpart of an Adversarial Wrapper."""
+
+import numpy as np
+
+from .adversarial_wrapper import ActionValidationMixin, AdversarialWrapper
+
+
+class VectorizedAdversarialWrapper(ActionValidationMixin):
+    r"""Step N copies of an adversarial environment with a batch of actions.
+
+    The wrapper receives an action array of shape (N, dim_action).
+    If dim_action equals the protagonist action dimension, then the step() method of
+    the environments inside each adversarial wrapper is called.
+    Otherwise, the actions are split into protagonist and antagonist actions and the
+    adversarial_step() method is called.
+
+    The bounds check and the split are done once for the whole batch.
+    The actions are validated as in the first environment, see `set_validation()'.
+    Sub-classes can override adversarial_step() to also mix the actions with array
+    operations.
+
+    When an environment is done, it is reset automatically and the last observation is
+    returned in info["terminal_observation"].
+
+    Parameters
+    ----------
+    envs: List[AdversarialWrapper].
+        List of adversarial environments of the same type.
+    """
+
+    def __init__(self, envs):
+        if len(envs) == 0:
+            raise ValueError("At least one environment must be given.")
+        if not all(isinstance(env, AdversarialWrapper) for env in envs):
+            raise TypeError("Only adversarial wrappers can be vectorized.")
+        if len(set(type(env) for env in envs)) > 1:
+            raise TypeError("All environments must have the same adversarial wrapper.")
+        self.envs = list(envs)
+        self.num_envs = len(envs)
+
+        env = self.envs[0]
+        self.protagonist_dim_action = env.protagonist_dim_action
+        self.antagonist_dim_action = env.antagonist_dim_action
+        self.observation_space = env.observation_space
+
+        self.protagonist_low = env.env.action_space.low
+        self.protagonist_high = env.env.action_space.high
+        self.set_validation(env.validation, env.validation_frequency, env.clip_actions)
+
+    def set_validation(self, validation="full", frequency=1000, clip_actions=False):
+        """Set how the actions are validated in all the environments.
+
+        See `ActionValidationMixin.set_validation()'. A step of all the environments
+        counts as a single step.
+        """
+        for env in self.envs:
+            env.set_validation(validation, frequency, clip_actions)
+        super().set_validation(validation, frequency, clip_actions)
+
+    def _check_action(self, actions, low, high):
+        """Clip and validate the actions of a step."""
+        if self.clip_actions:
+            actions = np.clip(actions, low, high)
+        if self.validate_step:
+            assert self._contains(actions, low, high), f"{actions} invalid"
+        return actions
+
+    @property
+    def alpha(self):
+        """Return robustness level."""
+        return self.envs[0].alpha
+
+    @alpha.setter
+    def alpha(self, alpha):
+        """Set robustness level of all environments."""
+        for env in self.envs:
+            env.alpha = alpha
+
+    @property
+    def action_space(self):
+        """Return the action space of a single environment."""
+        return self.envs[0].action_space
+
+    @property
+    def low(self):
+        """Get lower bound of the joint actions."""
+        return self.action_space.low
+
+    @property
+    def high(self):
+        """Get upper bound of the joint actions."""
+        return self.action_space.high
+
+    @classmethod
+    def from_env_fn(cls, env_fn, num_envs, *args, **kwargs):
+        """Create `num_envs' environments by calling env_fn."""
+        return cls([env_fn(*args, **kwargs) for _ in range(num_envs)])
+
+    def seed(self, seed=None):
+        """Seed all environments with consecutive seeds."""
+        if seed is None:
+            return [env.seed() for env in self.envs]
+        return [env.seed(seed + i) for i, env in enumerate(self.envs)]
+
+    def reset(self):
+        """Reset all environments and stack the observations."""
+        return np.stack([env.reset() for env in self.envs])
+
+    def step(self, actions):
+        """Step all environments with an array of shape (N, dim_action).
+
+        Returns
+        -------
+        observations: np.ndarray.
+            Array of shape (N, dim_state).
+        rewards: np.ndarray.
+            Array of shape (N,).
+        dones: np.ndarray.
+            Array of shape (N,).
+        infos: List[dict].
+            List of N info dictionaries.
+        """
+        actions = np.asarray(actions)
+        if actions.ndim != 2 or actions.shape[0] != self.num_envs:
+            raise ValueError(
+                f"actions must have shape ({self.num_envs}, dim_action) "
+                f"and {actions.shape} was given."
+            )
+
+        # The environments are not stepped through their step(), count it for them.
+        self._advance_validation()
+        for env in self.envs:
+            env._advance_validation()
+
+        p_dim = self.protagonist_dim_action[0]
+        if actions.shape[-1] == p_dim:
+            actions = self._check_action(
+                actions, self.protagonist_low, self.protagonist_high
+            )
+            results = [env.env.step(a) for env, a in zip(self.envs, actions)]
+        else:
+            assert actions.shape[-1] == self.action_space.shape[0], "Invalid shape."
+            actions = self._check_action(actions, self.low, self.high)
+
+            results = self.adversarial_step(actions[:, :p_dim], actions[:, p_dim:])
+
+        return self._stack_results(results)
+
+    def adversarial_step(self, protagonist_actions, antagonist_actions):
+        """Perform an adversarial step on each environment.
+
+        Parameters
+        ----------
+        protagonist_actions: np.ndarray.
+            Array of shape (N, protagonist_dim_action).
+        antagonist_actions: np.ndarray.
+            Array of shape (N, antagonist_dim_action).
+
+        Returns
+        -------
+        results: List[Tuple[np.ndarray, float, bool, dict]].
+            List with the output of each environment step.
+        """
+        return [
+            env.adversarial_step(p_action, a_action)
+            for env, p_action, a_action in zip(
+                self.envs, protagonist_actions, antagonist_actions
+            )
+        ]
+
+    def _stack_results(self, results):
+        """Stack the step results and reset the environments that are done."""
+        observations, rewards, dones, infos = map(list, zip(*results))
+        for i, (env, done) in enumerate(zip(self.envs, dones)):
+            if done:
+                infos[i]["terminal_observation"] = observations[i]
+                observations[i] = env.reset()
+        return (
+            np.stack(observations),
+            np.array(rewards, dtype=np.float32),
+            np.array(dones, dtype=np.bool_),
+            infos,
+        )
+
+    @staticmethod
+    def _contains(actions, low, high):
+        """Check that all the actions are inside the bounds."""
+        return bool(np.all(actions >= low) and np.all(actions <= high))
+
+    def close(self):
+        """Close all environments."""
+        for env in self.envs:
+            env.close()
+
+    @property
+    def name(self):
+        """Vectorized-Wrapper name."""
+        return f"Vectorized {self.envs[0].name}"
@@ -0,0 +1,56 @@
+"""Vectorized counterpart of an Adversarial Wrapper."""
+from typing import Any, Callable, List, Optional, Tuple
+
+import numpy as np
+from gym.spaces import Box
+
+from .adversarial_wrapper import ActionValidationMixin, AdversarialWrapper
+
+class VectorizedAdversarialWrapper(ActionValidationMixin):
+    envs: List[AdversarialWrapper]
+    num_envs: int
+    protagonist_dim_action: Tuple[int]
+    antagonist_dim_action: Tuple[int]
+    protagonist_low: np.ndarray
+    protagonist_high: np.ndarray
+    def __init__(self, envs: List[AdversarialWrapper]) -> None: ...
+    def set_validation(
+        self, validation: str = ..., frequency: int = ..., clip_actions: bool = ...
+    ) -> None: ...
+    def _check_action(
+        self, actions: np.ndarray, low: np.ndarray, high: np.ndarray
+    ) -> np.ndarray: ...
+    @property
+    def alpha(self) -> float: ...
+    @alpha.setter
+    def alpha(self, alpha: float) -> None: ...
+    @property
+    def action_space(self) -> Box: ...
+    @property
+    def low(self) -> np.ndarray: ...
+    @property
+    def high(self) -> np.ndarray: ...
+    @classmethod
+    def from_env_fn(
+        cls,
+        env_fn: Callable[..., AdversarialWrapper],
+        num_envs: int,
+        *args: Any,
+        **kwargs: Any,
+    ) -> VectorizedAdversarialWrapper: ...
+    def seed(self, seed: Optional[int] = ...) -> List[Any]: ...
+    def reset(self) -> np.ndarray: ...
+    def step(
+        self, actions: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[dict]]: ...
+    def adversarial_step(
+        self, protagonist_actions: np.ndarray, antagonist_actions: np.ndarray
+    ) -> List[Tuple[np.ndarray, float, bool, dict]]: ...
+    def _stack_results(
+        self, results: List[Tuple[np.ndarray, float, bool, dict]]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[dict]]: ...
+    @staticmethod
+    def _contains(actions: np.ndarray, low: np.ndarray, high: np.ndarray) -> bool: ...
+    def close(self) -> None: ...
+    @property
+    def name(self) -> str: ...
@@ -1,2 +1,3 @@
 """Python Script Template."""
 from .hallucinated_model import HallucinatedModel
+from .prediction_cache import PredictionCache
@@ -4,11 +4,24 @@ from rllib.model.transformed_model import TransformedModel
 
 
 class HallucinatedModel(TransformedModel):
-    """A Hallucinated Model returns a Delta at the hallucinated next state."""
+    """A Hallucinated Model returns a Delta at the hallucinated next state.
+
+    If the base model predicts all the heads of an ensemble in one call, i.e., the
+    mean has shape [*batch_shape, num_heads, dim], the heads are reduced to their
+    mean and epistemic scale before the transformations, e.g., DeltaState, and the
+    optimism is applied with the epistemic scale.
+
+    If `prediction_cache' is set, the predictions are read from it, see
+    `PredictionCache'.
+    """
 
     def __init__(self, base_model, transformations, beta=1.0):
         super().__init__(base_model, transformations)
         self.beta = beta
+        self.prediction_cache = None
+        self._reduce_heads = False
+        if hasattr(self.base_model, "num_heads"):
+            self.base_model.register_forward_hook(self._epistemic_hook)
 
     def forward(self, state, action, next_state=None):
         """Get Optimistic Next state."""
@@ -25,13 +38,91 @@ class HallucinatedModel(TransformedModel):
             )
         optimism_vars = torch.clamp(optimism_vars, -1.0, 1.0)
 
-        mean, tril = self.predict(state, control_action)
-        if torch.all(tril == 0.0) or optimism_vars.shape[-1] == 0:
+        if self.prediction_cache is None:
+            mean, tril = self._predict_moments(state, control_action)
+        else:
+            mean, tril = self.prediction_cache.predict(
+                self, self._predict_moments, state, control_action
+            )
+        if self.zero_scale or optimism_vars.shape[-1] == 0:
             return mean, tril
-        return (
-            mean + self.beta * (tril @ optimism_vars.unsqueeze(-1)).squeeze(-1),
-            torch.zeros_like(tril),
+        return self.optimistic_mean(mean, tril, optimism_vars), torch.zeros_like(tril)
+
+    def _predict_moments(self, state, action):
+        """Predict the mean and the scale of the next state."""
+        self._reduce_heads = True
+        try:
+            return self.predict(state, action)
+        finally:
+            self._reduce_heads = False
+
+    @property
+    def zero_scale(self):
+        """Check if the base model predicts a zero scale, without reading the scale.
+
+        Deterministic models predict a zero scale, but deterministic ensembles still
+        predict the epistemic scale of their heads. When the scale is zero but it is
+        not known statically, the optimism adds zero to the mean.
+        """
+        return getattr(self.base_model, "deterministic", False) and not hasattr(
+            self.base_model, "num_heads"
+        )
+
+    def _epistemic_hook(self, base_model, inputs, output):
+        """Reduce the predictions of all the heads before the transformations.
+
+        The heads are only reduced when the base model is called from `forward',
+        e.g., not when the base model is trained.
+        """
+        if not self._reduce_heads:
+            return None
+        mean = output[0]
+        if mean.dim() > inputs[0].dim() and mean.shape[-2] == base_model.num_heads:
+            return self.epistemic_moments(mean)
+        return None
+
+    @staticmethod
+    def epistemic_moments(mean):
+        """Get the mean and the epistemic scale of the predictions of all heads.
+
+        Parameters
+        ----------
+        mean: Tensor.
+            Mean of each head, with shape [*batch_shape, num_heads, dim].
+
+        Returns
+        -------
+        mean: Tensor.
+            Mean of the heads, with shape [*batch_shape, dim].
+        tril: Tensor.
+            Cholesky factor of the covariance of the heads, with shape
+            [*batch_shape, dim, dim]. Where the factorization fails, it is the
+            square root of the covariance from its eigendecomposition.
+        """
+        ensemble_mean = mean.mean(-2)
+        centered = mean - ensemble_mean.unsqueeze(-2)
+        covariance = centered.transpose(-2, -1) @ centered / mean.shape[-2]
+        jitter = 1e-6 * torch.eye(mean.shape[-1], dtype=mean.dtype, device=mean.device)
+        tril, info = torch.linalg.cholesky_ex(covariance + jitter)
+        eigenvalues, eigenvectors = torch.linalg.eigh(covariance)
+        sqrt = eigenvectors * eigenvalues.clamp_min(0.0).sqrt().unsqueeze(-2)
+        return ensemble_mean, torch.where((info > 0)[..., None, None], sqrt, tril)
+
+    def optimistic_mean(self, mean, tril, optimism_vars):
+        """Compute mean + beta * tril @ optimism_vars in a single batched matmul."""
+        dim = mean.shape[-1]
+        if mean.dim() + 1 != tril.dim() or tril.shape[-1] != dim:
+            return mean + self.beta * (tril @ optimism_vars.unsqueeze(-1)).squeeze(-1)
+        batch_shape = torch.broadcast_shapes(
+            mean.shape[:-1], tril.shape[:-2], optimism_vars.shape[:-1]
+        )
+        optimistic_mean = torch.baddbmm(
+            mean.expand(*batch_shape, dim).reshape(-1, dim, 1),
+            tril.expand(*batch_shape, dim, dim).reshape(-1, dim, dim),
+            optimism_vars.expand(*batch_shape, dim).reshape(-1, dim, 1),
+            alpha=self.beta,
         )
+        return optimistic_mean.reshape(*batch_shape, dim)
 
     def scale(self, state, action):
         """Get scale at current state-action pair."""
@@ -1,4 +1,4 @@
-from typing import Any, List, Tuple, Union
+from typing import Any, List, Optional, Tuple, Union
 
 import torch.nn as nn
 from rllib.dataset.datatypes import TupleDistribution
@@ -6,11 +6,15 @@ from rllib.model.abstract_model import AbstractModel
 from rllib.model.transformed_model import TransformedModel
 from torch import Tensor
 
+from .prediction_cache import PredictionCache
+
 class HallucinatedModel(TransformedModel):
     """Optimistic Model returns a Delta at the optimistic next state."""
 
     _true_dim_action: Tuple
     beta: float
+    prediction_cache: Optional[PredictionCache]
+    _reduce_heads: bool
     def __init__(
         self,
         base_model: AbstractModel,
@@ -19,3 +23,14 @@ class HallucinatedModel(TransformedModel):
         hallucinate_rewards: bool = ...,
     ) -> None: ...
     def forward(self, *args: Tensor, **kwargs: Any) -> TupleDistribution: ...
+    def _predict_moments(self, state: Tensor, action: Tensor) -> TupleDistribution: ...
+    @property
+    def zero_scale(self) -> bool: ...
+    def _epistemic_hook(
+        self, base_model: AbstractModel, inputs: Tuple[Tensor, ...], output: Any
+    ) -> Optional[Tuple[Tensor, Tensor]]: ...
+    @staticmethod
+    def epistemic_moments(mean: Tensor) -> Tuple[Tensor, Tensor]: ...
+    def optimistic_mean(
+        self, mean: Tensor, tril: Tensor, optimism_vars: Tensor
+    ) -> Tensor: ...
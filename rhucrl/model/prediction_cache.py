@@ -0,0 +1,103 @@
+"""Cache of model predictions shared between the updates of a learning round."""
+import time
+
+
+class PredictionCache(object):
+    """Cache the (mean, tril) predictions of models during a learning round.
+
+    An entry is keyed on the sampled batch, on the model object and the version of
+    its parameters, and on the input state and action. Hence, the updates of both
+    players reuse the predictions of a shared model on the same batch, and any
+    optimizer step on the model invalidates its entries.
+
+    The cache is only used inside a `with cache:' block, e.g., during the policy
+    updates but not during model learning, and only when `batch' is set.
+    Only predictions on inputs that do not require grad are cached, e.g., on the
+    sampled transitions or on targets computed under `torch.no_grad()'. Predictions
+    on actions of the policy are always recomputed. The cached predictions are
+    detached from the model parameters, which the policy optimizers do not update.
+
+    Parameters
+    ----------
+    max_size: int.
+        Maximum number of entries per batch and model.
+    """
+
+    def __init__(self, max_size=32):
+        self.max_size = max_size
+        self.active = False
+        self.batch = None
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.time_saved = 0.0
+
+    def __enter__(self):
+        """Start using the cache."""
+        self.active = True
+        return self
+
+    def __exit__(self, *args):
+        """Stop using the cache."""
+        self.active = False
+        self.batch = None
+
+    @staticmethod
+    def model_version(model):
+        """Get the identity and the in-place version of the model parameters."""
+        return tuple((p.data_ptr(), p._version) for p in model.parameters())
+
+    def predict(self, model, function, state, action):
+        """Return the cached prediction `function(state, action)' of the model."""
+        if (
+            not self.active
+            or self.batch is None
+            or state.requires_grad
+            or action.requires_grad
+        ):
+            return function(state, action)
+
+        key = (self.batch, id(model), self.model_version(model))
+        entries = self.entries.setdefault(key, [])
+        for entry_state, entry_action, versions, prediction, compute_time in entries:
+            if (
+                versions == (entry_state._version, entry_action._version)
+                and entry_state.shape == state.shape
+                and entry_action.shape == action.shape
+                and (entry_state is state or entry_state.equal(state))
+                and (entry_action is action or entry_action.equal(action))
+            ):
+                self.hits += 1
+                self.time_saved += compute_time
+                return prediction
+
+        start = time.perf_counter()
+        prediction = tuple(tensor.detach() for tensor in function(state, action))
+        compute_time = time.perf_counter() - start
+        self.misses += 1
+        entries.append(
+            (state, action, (state._version, action._version), prediction, compute_time)
+        )
+        if len(entries) > self.max_size:
+            entries.pop(0)
+        return prediction
+
+    @property
+    def hit_rate(self):
+        """Return the fraction of cacheable predictions read from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def statistics(self):
+        """Return the statistics of the cache to log."""
+        return {
+            "prediction_cache_hit_rate": self.hit_rate,
+            "prediction_cache_time_saved": self.time_saved,
+        }
+
+    def reset(self):
+        """Clear the entries and the statistics."""
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.time_saved = 0.0
@@ -0,0 +1,29 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from rllib.model.abstract_model import AbstractModel
+from torch import Tensor
+
+class PredictionCache(object):
+    max_size: int
+    active: bool
+    batch: Optional[int]
+    entries: Dict[Tuple[Any, ...], List[Tuple[Any, ...]]]
+    hits: int
+    misses: int
+    time_saved: float
+    def __init__(self, max_size: int = ...) -> None: ...
+    def __enter__(self) -> PredictionCache: ...
+    def __exit__(self, *args: Any) -> None: ...
+    @staticmethod
+    def model_version(model: AbstractModel) -> Tuple[Tuple[int, int], ...]: ...
+    def predict(
+        self,
+        model: AbstractModel,
+        function: Callable[[Tensor, Tensor], Tuple[Tensor, Tensor]],
+        state: Tensor,
+        action: Tensor,
+    ) -> Tuple[Tensor, Tensor]: ...
+    @property
+    def hit_rate(self) -> float: ...
+    def statistics(self) -> Dict[str, float]: ...
+    def reset(self) -> None: ...
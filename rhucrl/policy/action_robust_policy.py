@@ -5,6 +5,7 @@ import torch
 from rllib.policy.nn_policy import NNPolicy
 
 from .split_policy import SplitPolicy
+from .utilities import get_diagonal_scale
 
 
 class ActionRobustPolicy(SplitPolicy, metaclass=ABCMeta):
@@ -32,9 +33,26 @@ class ActionRobustPolicy(SplitPolicy, metaclass=ABCMeta):
 
     @classmethod
     def default(
-        cls, environment, hallucinate_protagonist=True, alpha=None, *args, **kwargs
+        cls,
+        environment,
+        hallucinate_protagonist=True,
+        alpha=None,
+        diagonal_scale=False,
+        *args,
+        **kwargs,
     ):
         """See `NNPolicy.default'."""
+        return cls(
+            **cls._default_kwargs(
+                environment, hallucinate_protagonist, alpha, diagonal_scale
+            )
+        )
+
+    @staticmethod
+    def _default_kwargs(
+        environment, hallucinate_protagonist=True, alpha=None, diagonal_scale=False
+    ):
+        """Get the arguments of a default policy for the environment."""
         protagonist_policy = NNPolicy(
             dim_state=environment.dim_state, dim_action=environment.dim_action
         )
@@ -47,7 +65,7 @@ class ActionRobustPolicy(SplitPolicy, metaclass=ABCMeta):
         )
         if alpha is None:
             alpha = environment.alpha
-        return cls(
+        return dict(
             alpha=alpha,
             dim_state=environment.dim_state,
             dim_action=environment.dim_action,
@@ -55,6 +73,7 @@ class ActionRobustPolicy(SplitPolicy, metaclass=ABCMeta):
             antagonist_policy=antagonist_policy,
             hallucination_policy=hallucination_policy,
             hallucinate_protagonist=hallucinate_protagonist,
+            diagonal_scale=diagonal_scale,
         )
 
 
@@ -75,9 +94,9 @@ class NoisyActionRobustPolicy(ActionRobustPolicy):
         a_mean, a_scale_tril = self.antagonist_policy(state)
         h_mean, h_scale_tril = self.hallucination_policy(state)
 
-        p_std = p_scale_tril.diagonal(dim1=-1, dim2=-2)
-        a_std = a_scale_tril.diagonal(dim1=-1, dim2=-2)
-        h_std = h_scale_tril.diagonal(dim1=-1, dim2=-2)
+        p_std = get_diagonal_scale(p_mean, p_scale_tril)
+        a_std = get_diagonal_scale(a_mean, a_scale_tril)
+        h_std = get_diagonal_scale(h_mean, h_scale_tril)
 
         mean = (1 - self.alpha) * p_mean + self.alpha * a_mean
         std = (1 - self.alpha) * p_std + self.alpha * a_std
@@ -90,20 +109,70 @@ class ProbabilisticActionRobustPolicy(ActionRobustPolicy):
 
     It samples the protagonist with probability 1-alpha and the antagonist with alpha.
 
+    Parameters
+    ----------
+    batched: bool, optional (default=False).
+        If True, the player is sampled independently for each state of the batch.
+        Both sub-policies are evaluated and merged with a Bernoulli mask.
+        Otherwise, a single player is sampled for the whole batch.
+
     References
     ----------
     Tessler, C., Efroni, Y., & Mannor, S. (2019).
     Action robust reinforcement learning and applications in continuous control. ICML.
     """
 
+    def __init__(self, alpha, batched=False, *args, **kwargs):
+        super().__init__(alpha, *args, **kwargs)
+        self.batched = batched
+
     def forward(self, state):
         """Compute policy."""
+        if self.batched:
+            return self._forward_batched(state)
         h_mean, h_scale_tril = self.hallucination_policy(state)
         if torch.rand(1).item() < self.alpha:
             mean, scale_tril = self.antagonist_policy(state)
         else:
             mean, scale_tril = self.protagonist_policy(state)
-        std = scale_tril.diagonal(dim1=-1, dim2=-2)
-        h_std = h_scale_tril.diagonal(dim1=-1, dim2=-2)
+        std = get_diagonal_scale(mean, scale_tril)
+        h_std = get_diagonal_scale(h_mean, h_scale_tril)
 
         return self.stack_policies((mean, h_mean), (std, h_std))
+
+    def _forward_batched(self, state):
+        """Compute policy sampling the player of each state."""
+        h_mean, h_scale_tril = self.hallucination_policy(state)
+        p_mean, p_scale_tril = self.protagonist_policy(state)
+        a_mean, a_scale_tril = self.antagonist_policy(state)
+
+        antagonist = torch.rand(p_mean.shape[:-1] + (1,), device=p_mean.device)
+        antagonist = antagonist < self.alpha
+        mean = torch.where(antagonist, a_mean, p_mean)
+        std = torch.where(
+            antagonist,
+            get_diagonal_scale(a_mean, a_scale_tril),
+            get_diagonal_scale(p_mean, p_scale_tril),
+        )
+        h_std = get_diagonal_scale(h_mean, h_scale_tril)
+
+        return self.stack_policies((mean, h_mean), (std, h_std))
+
+    @classmethod
+    def default(
+        cls,
+        environment,
+        hallucinate_protagonist=True,
+        alpha=None,
+        diagonal_scale=False,
+        batched=False,
+        *args,
+        **kwargs,
+    ):
+        """See `ActionRobustPolicy.default'."""
+        return cls(
+            batched=batched,
+            **cls._default_kwargs(
+                environment, hallucinate_protagonist, alpha, diagonal_scale
+            ),
+        )
@@ -7,7 +7,26 @@ from rllib.policy import AbstractPolicy, NNPolicy
 
 
 class AdversarialPolicy(AbstractPolicy, metaclass=ABCMeta):
-    """Given a protagonist and an antagonist policy, combine to give a joint policy."""
+    """Given a protagonist and an antagonist policy, combine to give a joint policy.
+
+    Parameters
+    ----------
+    protagonist_policy: AbstractPolicy.
+        Protagonist policy.
+    antagonist_policy: AbstractPolicy.
+        Antagonist policy.
+    hallucination_policy: AbstractPolicy, optional.
+        Hallucination policy.
+    protagonist: bool, optional (default=True).
+        If True, the policy starts in protagonist mode.
+    diagonal_scale: bool, optional (default=False).
+        If True, the policy returns the standard deviation of a diagonal normal
+        distribution instead of a scale_tril matrix. This avoids allocating a
+        [*batch_shape, dim_action, dim_action] tensor, but it is only understood by
+        the consumers of rhucrl, e.g., `get_diagonal_scale' or the action robust
+        pathwise losses. rllib expects a scale_tril, hence it must be False for a
+        policy that an rllib agent acts with or optimizes.
+    """
 
     def __init__(
         self,
@@ -15,6 +34,7 @@ class AdversarialPolicy(AbstractPolicy, metaclass=ABCMeta):
         antagonist_policy,
         hallucination_policy=None,
         protagonist=True,
+        diagonal_scale=False,
         *args,
         **kwargs,
     ) -> None:
@@ -31,19 +51,52 @@ class AdversarialPolicy(AbstractPolicy, metaclass=ABCMeta):
         assert protagonist_policy.dim_state == self.dim_state
 
         self._protagonist = protagonist
+        self._maximin = False
+        self.diagonal_scale = diagonal_scale
         if hallucination_policy is None:
             hallucination_policy = NNPolicy(
                 dim_state=self.dim_state, dim_action=self.dim_action
             )
         self._hallucination_policy = hallucination_policy
+        self._update_dispatch()
+
+    def _update_dispatch(self):
+        """Resolve the sub-policies that each mode uses.
+
+        The protagonist, antagonist, and hallucination policies only change in the
+        `set_*_policy' methods, hence the properties read them from this table
+        instead of resolving the augmented policies on every access.
+        """
+        if isinstance(self._protagonist_policy, AugmentedPolicy):
+            protagonist_policy = self._protagonist_policy.true_policy
+        else:
+            protagonist_policy = self._protagonist_policy
+
+        if isinstance(self._antagonist_policy, AugmentedPolicy):
+            antagonist_policy = self._antagonist_policy.true_policy
+        else:
+            antagonist_policy = self._antagonist_policy
+
+        self._dispatch = {}
+        for protagonist in [True, False]:
+            if isinstance(self._protagonist_policy, AugmentedPolicy) and protagonist:
+                hallucination_policy = self._protagonist_policy.hallucination_policy
+            elif (
+                isinstance(self._antagonist_policy, AugmentedPolicy) and not protagonist
+            ):
+                hallucination_policy = self._antagonist_policy.hallucination_policy
+            else:
+                hallucination_policy = self._hallucination_policy
+            self._dispatch[protagonist] = (
+                protagonist_policy,
+                antagonist_policy,
+                hallucination_policy,
+            )
 
     @property
     def protagonist_policy(self):
         """Return protagonist policy."""
-        if isinstance(self._protagonist_policy, AugmentedPolicy):
-            return self._protagonist_policy.true_policy
-        else:
-            return self._protagonist_policy
+        return self._dispatch[self._protagonist][0]
 
     def set_protagonist_policy(self, new_policy):
         """Set protagonist policy."""
@@ -57,14 +110,12 @@ class AdversarialPolicy(AbstractPolicy, metaclass=ABCMeta):
                 self._protagonist_policy.true_policy = new_policy
         else:
             self._protagonist_policy = new_policy
+        self._update_dispatch()
 
     @property
     def antagonist_policy(self):
         """Return antagonist policy."""
-        if isinstance(self._antagonist_policy, AugmentedPolicy):
-            return self._antagonist_policy.true_policy
-        else:
-            return self._antagonist_policy
+        return self._dispatch[self._protagonist][1]
 
     def set_antagonist_policy(self, new_policy):
         """Set antagonist policy."""
@@ -78,16 +129,12 @@ class AdversarialPolicy(AbstractPolicy, metaclass=ABCMeta):
                 self._antagonist_policy.true_policy = new_policy
         else:
             self._antagonist_policy = new_policy
+        self._update_dispatch()
 
     @property
     def hallucination_policy(self):
         """Return hallucination policy."""
-        if isinstance(self._protagonist_policy, AugmentedPolicy) and self.protagonist:
-            return self._protagonist_policy.hallucination_policy
-        elif isinstance(self._antagonist_policy, AugmentedPolicy) and self.antagonist:
-            return self._antagonist_policy.hallucination_policy
-        else:
-            return self._hallucination_policy
+        return self._dispatch[self._protagonist][2]
 
     def set_hallucination_policy(self, new_policy):
         """Set hallucination policy."""
@@ -98,6 +145,7 @@ class AdversarialPolicy(AbstractPolicy, metaclass=ABCMeta):
                 self._antagonist_policy.true_policy = new_policy
         else:
             self._hallucination_policy = new_policy
+        self._update_dispatch()
 
     @property
     def protagonist(self):
@@ -119,6 +167,16 @@ class AdversarialPolicy(AbstractPolicy, metaclass=ABCMeta):
         """Set protagonist value."""
         self._protagonist = not new_value
 
+    @property
+    def maximin(self):
+        """Return true if it is in maxi-min mode."""
+        return self._maximin
+
+    @maximin.setter
+    def maximin(self, new_value):
+        """Set maxi-min value."""
+        self._maximin = new_value
+
     @property
     def deterministic(self):
         """Get flag if the policy is deterministic or not."""
@@ -160,6 +218,8 @@ class AdversarialPolicy(AbstractPolicy, metaclass=ABCMeta):
         """Stack a set of policies."""
         mean = torch.cat(means, dim=-1)[..., : self.dim_action[0]]
         std = torch.cat(stds, dim=-1)[..., : self.dim_action[0]]
+        if self.diagonal_scale:
+            return mean, std
         return mean, std.diag_embed()
 
     def forward(self, state):
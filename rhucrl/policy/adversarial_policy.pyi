@@ -1,5 +1,5 @@
 """Python Script Template."""
-from typing import Any, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from rllib.dataset.datatypes import TupleDistribution
 from rllib.policy import AbstractPolicy
@@ -11,14 +11,19 @@ class AdversarialPolicy(AbstractPolicy):
     _protagonist_policy: AbstractPolicy
     _antagonist_policy: AbstractPolicy
     _hallucination_policy: AbstractPolicy
+    diagonal_scale: bool
+    _dispatch: Dict[bool, Tuple[AbstractPolicy, AbstractPolicy, AbstractPolicy]]
     def __init__(
         self,
         protagonist_policy: AbstractPolicy,
         antagonist_policy: AbstractPolicy,
+        hallucination_policy: Optional[AbstractPolicy] = ...,
         protagonist: bool = ...,
+        diagonal_scale: bool = ...,
         *args: Any,
         **kwargs: Any,
     ) -> None: ...
+    def _update_dispatch(self) -> None: ...
     @property
     def protagonist(self) -> bool: ...
     @protagonist.setter
@@ -28,6 +33,10 @@ class AdversarialPolicy(AbstractPolicy):
     @antagonist.setter
     def antagonist(self, new_value: bool) -> None: ...
     @property
+    def maximin(self) -> bool: ...
+    @maximin.setter
+    def maximin(self, new_value: bool) -> None: ...
+    @property
     def protagonist_policy(self) -> AbstractPolicy: ...
     def set_protagonist_policy(self, new_policy: AbstractPolicy) -> None: ...
     @property
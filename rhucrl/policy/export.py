@@ -0,0 +1,84 @@
+"""Export the protagonist of an adversarial policy for deployment."""
+import torch
+import torch.nn as nn
+from rllib.util.neural_networks.utilities import deep_copy_module
+
+
+class DeterministicActor(nn.Module):
+    """Deterministic actor that returns the scaled mean action of a policy.
+
+    The forward method has no python dispatch on the policy mode or on the kind of
+    the sub-policies, hence it can be traced or compiled.
+
+    Parameters
+    ----------
+    policy: AbstractPolicy.
+        Policy to export. It is copied, hence later updates do not affect the actor.
+    dim_action: int.
+        Number of entries of the policy mean that are actions. The remaining entries,
+        e.g. hallucination actions, are discarded.
+    action_scale: Tensor.
+        Scale of the actions.
+    """
+
+    def __init__(self, policy, dim_action, action_scale):
+        super().__init__()
+        self.policy = deep_copy_module(policy)
+        self.policy.deterministic = True
+        self.policy.eval()
+        self.dim_action = dim_action
+        action_scale = torch.as_tensor(action_scale, dtype=torch.get_default_dtype())
+        if action_scale.dim() > 0:
+            action_scale = action_scale[..., :dim_action]
+        self.register_buffer("action_scale", action_scale)
+
+    def forward(self, state):
+        """Get the deterministic action of the policy."""
+        mean = self.policy(state)[0][..., : self.dim_action]
+        return self.action_scale * mean.clamp(-1.0, 1.0)
+
+
+def export_protagonist(
+    policy, example_state, dim_action=None, action_scale=None, method="trace"
+):
+    """Freeze the protagonist of an adversarial policy into a deployable module.
+
+    Parameters
+    ----------
+    policy: AdversarialPolicy.
+        Trained adversarial policy.
+    example_state: Tensor.
+        Example input to trace the protagonist policy. A traced actor is specialized
+        to the number of dimensions of the example, hence trace with a single state
+        for single-state inference and with a batch of states for batched inference.
+    dim_action: int, optional.
+        Protagonist action dimension. By default, the protagonist policy dimension.
+    action_scale: Tensor, optional.
+        Protagonist action scale. By default, the leading entries of the policy scale.
+    method: str, optional (default="trace").
+        If "trace", the actor is traced and frozen as a TorchScript module.
+        If "compile", the actor is compiled with `torch.compile'.
+        If "eager", the actor is returned as it is.
+
+    Returns
+    -------
+    actor: nn.Module.
+        Module that maps states to protagonist actions.
+    """
+    protagonist_policy = policy.protagonist_policy
+    if dim_action is None:
+        dim_action = protagonist_policy.dim_action[0]
+    if action_scale is None:
+        action_scale = policy.action_scale
+    actor = DeterministicActor(protagonist_policy, dim_action, action_scale).eval()
+
+    if method == "trace":
+        with torch.no_grad():
+            traced_actor = torch.jit.trace(actor, example_state)
+        return torch.jit.freeze(traced_actor)
+    elif method == "compile":
+        return torch.compile(actor)
+    elif method == "eager":
+        return actor
+    else:
+        raise NotImplementedError(f"{method} export method not implemented.")
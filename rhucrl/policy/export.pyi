@@ -0,0 +1,26 @@
+"""Python Script Template."""
+from typing import Optional
+
+import torch.nn as nn
+from rllib.dataset.datatypes import Action
+from rllib.policy import AbstractPolicy
+from torch import Tensor
+
+from .adversarial_policy import AdversarialPolicy
+
+class DeterministicActor(nn.Module):
+    policy: AbstractPolicy
+    dim_action: int
+    action_scale: Tensor
+    def __init__(
+        self, policy: AbstractPolicy, dim_action: int, action_scale: Action
+    ) -> None: ...
+    def forward(self, state: Tensor) -> Tensor: ...
+
+def export_protagonist(
+    policy: AdversarialPolicy,
+    example_state: Tensor,
+    dim_action: Optional[int] = ...,
+    action_scale: Optional[Action] = ...,
+    method: str = ...,
+) -> nn.Module: ...
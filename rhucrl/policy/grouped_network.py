@@ -0,0 +1,160 @@
+"""Grouped Gaussian network that evaluates several MLPs with batched matmuls."""
+import math
+
+import torch
+import torch.nn as nn
+from rllib.policy import AbstractPolicy
+
+
+class GroupedGaussianNN(nn.Module):
+    """Stack of G heteroscedastic Gaussian MLPs with the same hidden layers.
+
+    The weights of each layer are stored in a single (G, in, out) tensor, hence all
+    the MLPs are evaluated with one batched matmul per layer.
+    The output of group g is the first out_dims[g] entries of the (zero-padded) head.
+
+    Parameters
+    ----------
+    in_dim: int.
+        Input dimension.
+    out_dims: Tuple[int].
+        Output dimension of each group.
+    layers: Tuple[int].
+        Width of the hidden layers.
+    non_linearity: str.
+        Name of the non-linearity of the hidden layers.
+    squashed_output: bool.
+        If True, the mean is squashed with a tanh.
+    min_scale: float.
+        Minimum standard deviation.
+    max_scale: float.
+        Maximum standard deviation.
+    """
+
+    def __init__(
+        self,
+        in_dim,
+        out_dims,
+        layers=(32, 32),
+        non_linearity="Tanh",
+        squashed_output=True,
+        min_scale=1e-6,
+        max_scale=1.0,
+    ):
+        super().__init__()
+        self.in_dim = in_dim
+        self.out_dims = tuple(out_dims)
+        self.layers = tuple(layers)
+        self.non_linearity_name = non_linearity
+        self.squashed_output = squashed_output
+        self.min_scale, self.max_scale = min_scale, max_scale
+
+        num_groups, max_out = len(self.out_dims), max(self.out_dims)
+        self.weights = nn.ParameterList()
+        self.biases = nn.ParameterList()
+        in_features = in_dim
+        for out_features in self.layers:
+            self.weights.append(
+                nn.Parameter(torch.empty(num_groups, in_features, out_features))
+            )
+            self.biases.append(nn.Parameter(torch.empty(num_groups, 1, out_features)))
+            in_features = out_features
+        self.mean_weight = nn.Parameter(torch.empty(num_groups, in_features, max_out))
+        self.mean_bias = nn.Parameter(torch.empty(num_groups, 1, max_out))
+        self.scale_weight = nn.Parameter(torch.empty(num_groups, in_features, max_out))
+        self.scale_bias = nn.Parameter(torch.empty(num_groups, 1, max_out))
+        self.non_linearity = getattr(nn, non_linearity)()
+        self.reset_parameters()
+
+    @property
+    def num_groups(self):
+        """Return number of groups."""
+        return len(self.out_dims)
+
+    def reset_parameters(self):
+        """Initialize each group as a `nn.Linear' layer."""
+        params = list(zip(self.weights, self.biases)) + [
+            (self.mean_weight, self.mean_bias),
+            (self.scale_weight, self.scale_bias),
+        ]
+        for weight, bias in params:
+            bound = 1 / math.sqrt(weight.shape[1])
+            nn.init.uniform_(weight, -bound, bound)
+            nn.init.uniform_(bias, -bound, bound)
+
+    def _head(self, x, mean_weight, mean_bias, scale_weight, scale_bias):
+        """Compute the mean and the standard deviation of the head."""
+        mean = torch.baddbmm(mean_bias, x, mean_weight)
+        if self.squashed_output:
+            mean = torch.tanh(mean)
+        scale = nn.functional.softplus(torch.baddbmm(scale_bias, x, scale_weight))
+        return mean, scale.clamp(self.min_scale, self.max_scale)
+
+    def forward(self, x):
+        """Compute the mean and the standard deviation of all groups.
+
+        Returns
+        -------
+        means: List[Tensor].
+            Mean of each group, with shape [*batch_shape, out_dims[g]].
+        scales: List[Tensor].
+            Standard deviation of each group, with shape [*batch_shape, out_dims[g]].
+        """
+        batch_shape = x.shape[:-1]
+        x = x.reshape(1, -1, self.in_dim).expand(self.num_groups, -1, -1)
+        for weight, bias in zip(self.weights, self.biases):
+            x = self.non_linearity(torch.baddbmm(bias, x, weight))
+        mean, scale = self._head(
+            x, self.mean_weight, self.mean_bias, self.scale_weight, self.scale_bias
+        )
+        means = [
+            mean[g, :, :dim].reshape(*batch_shape, dim)
+            for g, dim in enumerate(self.out_dims)
+        ]
+        scales = [
+            scale[g, :, :dim].reshape(*batch_shape, dim)
+            for g, dim in enumerate(self.out_dims)
+        ]
+        return means, scales
+
+    def forward_group(self, x, group):
+        """Compute the mean and the standard deviation of a single group."""
+        batch_shape, dim = x.shape[:-1], self.out_dims[group]
+        x = x.reshape(1, -1, self.in_dim)
+        for weight, bias in zip(self.weights, self.biases):
+            x = self.non_linearity(
+                torch.baddbmm(bias[group : group + 1], x, weight[group : group + 1])
+            )
+        mean, scale = self._head(
+            x,
+            self.mean_weight[group : group + 1, :, :dim],
+            self.mean_bias[group : group + 1, :, :dim],
+            self.scale_weight[group : group + 1, :, :dim],
+            self.scale_bias[group : group + 1, :, :dim],
+        )
+        return mean.reshape(*batch_shape, dim), scale.reshape(*batch_shape, dim)
+
+
+class GroupedPolicyMember(AbstractPolicy):
+    """Policy that evaluates a single group of a grouped network.
+
+    The grouped network is not registered as a sub-module, hence the parameters are
+    only owned by the policy that holds the grouped network.
+    If diagonal_scale is True, it returns the standard deviation instead of a
+    diagonal scale_tril, see `AdversarialPolicy'.
+    """
+
+    def __init__(self, grouped_nn, group, diagonal_scale=False, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__dict__["grouped_nn"] = grouped_nn
+        self.group = group
+        self.diagonal_scale = diagonal_scale
+
+    def forward(self, state):
+        """Get distribution over actions."""
+        mean, scale = self.grouped_nn.forward_group(state, self.group)
+        if self.deterministic:
+            scale = torch.zeros_like(scale)
+        if self.diagonal_scale:
+            return mean, scale
+        return mean, scale.diag_embed()
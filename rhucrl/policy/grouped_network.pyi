@@ -0,0 +1,60 @@
+"""Python Script Template."""
+from typing import Any, Iterable, List, Tuple
+
+import torch.nn as nn
+from rllib.dataset.datatypes import TupleDistribution
+from rllib.policy import AbstractPolicy
+from torch import Tensor
+
+class GroupedGaussianNN(nn.Module):
+    in_dim: int
+    out_dims: Tuple[int, ...]
+    layers: Tuple[int, ...]
+    non_linearity_name: str
+    squashed_output: bool
+    min_scale: float
+    max_scale: float
+    weights: nn.ParameterList
+    biases: nn.ParameterList
+    mean_weight: nn.Parameter
+    mean_bias: nn.Parameter
+    scale_weight: nn.Parameter
+    scale_bias: nn.Parameter
+    non_linearity: nn.Module
+    def __init__(
+        self,
+        in_dim: int,
+        out_dims: Iterable[int],
+        layers: Tuple[int, ...] = ...,
+        non_linearity: str = ...,
+        squashed_output: bool = ...,
+        min_scale: float = ...,
+        max_scale: float = ...,
+    ) -> None: ...
+    @property
+    def num_groups(self) -> int: ...
+    def reset_parameters(self) -> None: ...
+    def _head(
+        self,
+        x: Tensor,
+        mean_weight: Tensor,
+        mean_bias: Tensor,
+        scale_weight: Tensor,
+        scale_bias: Tensor,
+    ) -> Tuple[Tensor, Tensor]: ...
+    def forward(self, x: Tensor) -> Tuple[List[Tensor], List[Tensor]]: ...
+    def forward_group(self, x: Tensor, group: int) -> Tuple[Tensor, Tensor]: ...
+
+class GroupedPolicyMember(AbstractPolicy):
+    grouped_nn: GroupedGaussianNN
+    group: int
+    diagonal_scale: bool
+    def __init__(
+        self,
+        grouped_nn: GroupedGaussianNN,
+        group: int,
+        diagonal_scale: bool = ...,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None: ...
+    def forward(self, *args: Tensor, **kwargs: Any) -> TupleDistribution: ...
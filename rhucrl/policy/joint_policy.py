@@ -1,6 +1,7 @@
 """Python Script Template."""
 
 from .adversarial_policy import AdversarialPolicy
+from .utilities import get_diagonal_scale
 
 
 class JointPolicy(AdversarialPolicy):
@@ -19,8 +20,8 @@ class JointPolicy(AdversarialPolicy):
         p_mean, p_scale_tril = self.protagonist_policy(state)
         a_mean, a_scale_tril = self.antagonist_policy(state)
 
-        p_std = p_scale_tril.diagonal(dim1=-1, dim2=-2)
-        a_std = a_scale_tril.diagonal(dim1=-1, dim2=-2)
+        p_std = get_diagonal_scale(p_mean, p_scale_tril)
+        a_std = get_diagonal_scale(a_mean, a_scale_tril)
 
         if self.protagonist:
             h_mean = p_mean[..., p_dim:]
@@ -32,7 +33,7 @@ class JointPolicy(AdversarialPolicy):
             raise NotImplementedError
         if p_dim + a_dim < self.dim_action[0]:
             h_mean, h_scale_tril = self.hallucination_policy(state)
-            h_std = h_scale_tril.diagonal(dim1=-1, dim2=-2)
+            h_std = get_diagonal_scale(h_mean, h_scale_tril)
 
         p_mean, p_std = p_mean[..., :p_dim], p_std[..., :p_dim]
         a_mean, a_std = a_mean[..., :a_dim], a_std[..., :a_dim]
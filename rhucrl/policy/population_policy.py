@@ -0,0 +1,158 @@
+"""Population of policies stored in a single grouped network."""
+import torch
+from rllib.policy import AbstractPolicy
+
+from .grouped_network import GroupedGaussianNN
+
+
+class PopulationPolicy(AbstractPolicy):
+    """Population of Gaussian policies with their parameters stored contiguously.
+
+    The members are the groups of a `GroupedGaussianNN'. The policy evaluates the
+    active member, hence only the slice of the active member has non-zero gradients.
+    Optimizers with state, e.g. Adam, still move the slices of the other members
+    with their momentum. Wrap the optimizer with a `PopulationOptimizer' so that
+    only the active member is updated.
+    If the active member is None, all the members are evaluated in a single batched
+    pass and the outputs have a leading population dimension.
+
+    Parameters
+    ----------
+    num_members: int.
+        Number of members of the population.
+    layers: Tuple[int].
+        Width of the hidden layers of each member.
+    non_linearity: str.
+        Name of the non-linearity of the hidden layers.
+    squashed_output: bool.
+        If True, the means are squashed with a tanh.
+    diagonal_scale: bool.
+        If True, the policy returns the standard deviation instead of a diagonal
+        scale_tril. As in `AdversarialPolicy', it must be False for a policy that an
+        rllib agent acts with or optimizes.
+    """
+
+    def __init__(
+        self,
+        num_members,
+        layers=(32, 32),
+        non_linearity="Tanh",
+        squashed_output=True,
+        diagonal_scale=False,
+        *args,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.num_members = num_members
+        self.nn = GroupedGaussianNN(
+            in_dim=self.dim_state[0],
+            out_dims=[self.dim_action[0]] * num_members,
+            layers=layers,
+            non_linearity=non_linearity,
+            squashed_output=squashed_output,
+        )
+        self.member = 0
+        self.diagonal_scale = diagonal_scale
+
+    def forward(self, state):
+        """Get distribution over actions of the active member."""
+        if self.member is None:
+            means, scales = self.nn(state)
+            mean, scale = torch.stack(means), torch.stack(scales)
+        else:
+            mean, scale = self.nn.forward_group(state, self.member)
+        if self.deterministic:
+            scale = torch.zeros_like(scale)
+        if self.diagonal_scale:
+            return mean, scale
+        return mean, scale.diag_embed()
+
+    @classmethod
+    def default(cls, environment, num_members=5, diagonal_scale=False, *args, **kwargs):
+        """See `AbstractPolicy.default'."""
+        return cls(
+            num_members=num_members,
+            diagonal_scale=diagonal_scale,
+            dim_state=environment.dim_state,
+            dim_action=environment.dim_action,
+            action_scale=environment.action_scale,
+        )
+
+
+class PopulationOptimizer(object):
+    """Proxy of an optimizer that only updates the active member of a population.
+
+    The optimizer steps all the parameters. Afterwards, the slices of the inactive
+    members, in the parameters and in the optimizer state, are restored. Each member
+    also keeps its own step counter, which is set in the optimizer state before each
+    step. Hence each member keeps its own momentum and bias correction, as if it had
+    its own optimizer. When all the members are evaluated, they are stepped together
+    from the largest step counter.
+
+    Parameters
+    ----------
+    optimizer: torch.optim.Optimizer.
+        Optimizer of the population parameters, and possibly of other parameters.
+    policy: PopulationPolicy.
+        Population whose inactive members are kept fixed.
+    """
+
+    def __init__(self, optimizer, policy):
+        self.optimizer = optimizer
+        self.policy = policy
+        self.member_steps = [0] * policy.num_members
+
+    def __getattr__(self, name):
+        """Get attribute of the optimizer."""
+        if name in ["optimizer", "policy", "member_steps"]:
+            raise AttributeError(name)
+        return getattr(self.optimizer, name)
+
+    def _set_step(self, step):
+        """Set the step counter in the optimizer state of the population."""
+        for param in self.policy.nn.parameters():
+            state = self.optimizer.state.get(param, {})
+            if "step" not in state:
+                continue
+            if torch.is_tensor(state["step"]):
+                state["step"].fill_(step)
+            else:
+                state["step"] = step
+
+    def _inactive_slices(self):
+        """Copy the slices of the inactive members of the parameters and state."""
+        member, num_members = self.policy.member, self.policy.num_members
+        inactive = [i for i in range(num_members) if i != member]
+        slices = []
+        for param in self.policy.nn.parameters():
+            tensors = [param] + [
+                value
+                for value in self.optimizer.state.get(param, {}).values()
+                if torch.is_tensor(value) and value.shape == param.shape
+            ]
+            slices += [(tensor, tensor[inactive].clone()) for tensor in tensors]
+        return inactive, slices
+
+    def step(self, closure=None):
+        """Step the optimizer without updating the inactive members."""
+        member = self.policy.member
+        if member is None:
+            step = max(self.member_steps)
+            self._set_step(step)
+            self.member_steps = [step + 1] * self.policy.num_members
+            return self.optimizer.step(closure)
+        with torch.no_grad():
+            inactive, slices = self._inactive_slices()
+        self._set_step(self.member_steps[member])
+        self.member_steps[member] += 1
+        loss = self.optimizer.step(closure)
+        with torch.no_grad():
+            # The state of a parameter is created on its first step.
+            for param in self.policy.nn.parameters():
+                for value in self.optimizer.state.get(param, {}).values():
+                    if torch.is_tensor(value) and value.shape == param.shape:
+                        if not any(value is tensor for tensor, _ in slices):
+                            value[inactive] = 0.0
+            for tensor, value in slices:
+                tensor[inactive] = value
+        return loss
@@ -0,0 +1,50 @@
+"""Python Script Template."""
+from typing import Any, Callable, List, Optional, Tuple, Type, TypeVar
+
+from rllib.dataset.datatypes import TupleDistribution
+from rllib.environment import AbstractEnvironment
+from rllib.policy import AbstractPolicy
+from torch import Tensor
+from torch.optim.optimizer import Optimizer
+
+from .grouped_network import GroupedGaussianNN
+
+T = TypeVar("T", bound="PopulationPolicy")
+
+class PopulationPolicy(AbstractPolicy):
+    num_members: int
+    nn: GroupedGaussianNN
+    member: Optional[int]
+    diagonal_scale: bool
+    def __init__(
+        self,
+        num_members: int,
+        layers: Tuple[int, ...] = ...,
+        non_linearity: str = ...,
+        squashed_output: bool = ...,
+        diagonal_scale: bool = ...,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None: ...
+    def forward(self, *args: Tensor, **kwargs: Any) -> TupleDistribution: ...
+    @classmethod
+    def default(
+        cls: Type[T],
+        environment: AbstractEnvironment,
+        num_members: int = ...,
+        diagonal_scale: bool = ...,
+        *args: Any,
+        **kwargs: Any,
+    ) -> T: ...
+
+class PopulationOptimizer(object):
+    optimizer: Optimizer
+    policy: PopulationPolicy
+    member_steps: List[int]
+    def __init__(self, optimizer: Optimizer, policy: PopulationPolicy) -> None: ...
+    def __getattr__(self, name: str) -> Any: ...
+    def _set_step(self, step: int) -> None: ...
+    def _inactive_slices(self) -> Tuple[List[int], List[Tuple[Tensor, Tensor]]]: ...
+    def step(
+        self, closure: Optional[Callable[[], Tensor]] = ...
+    ) -> Optional[Tensor]: ...
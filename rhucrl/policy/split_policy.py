@@ -1,8 +1,11 @@
 """Python Script Template."""
 
+import torch
 from rllib.policy import NNPolicy
 
 from .adversarial_policy import AdversarialPolicy
+from .grouped_network import GroupedGaussianNN, GroupedPolicyMember
+from .utilities import get_diagonal_scale, reverse_gradient
 
 
 class SplitPolicy(AdversarialPolicy):
@@ -38,11 +41,28 @@ class SplitPolicy(AdversarialPolicy):
         a_mean, a_scale_tril = self.antagonist_policy(state)
         h_mean, h_scale_tril = self.hallucination_policy(state)
 
-        p_std = p_scale_tril.diagonal(dim1=-1, dim2=-2)
-        a_std = a_scale_tril.diagonal(dim1=-1, dim2=-2)
-        h_std = h_scale_tril.diagonal(dim1=-1, dim2=-2)
+        p_std = get_diagonal_scale(p_mean, p_scale_tril)
+        a_std = get_diagonal_scale(a_mean, a_scale_tril)
+        h_std = get_diagonal_scale(h_mean, h_scale_tril)
 
-        if self.protagonist:
+        return self.stack_policies(
+            *self.detach_inactive((p_mean, a_mean, h_mean), (p_std, a_std, h_std))
+        )
+
+    def detach_inactive(self, means, stds):
+        """Detach the means and stds of the policies that are not being optimized.
+
+        In maxi-min mode, nothing is detached. Instead, the gradient of the antagonist
+        outputs, and of the hallucination outputs if the antagonist hallucinates, is
+        reversed. Hence, it is reversed wherever the joint action is used, e.g., in
+        the critic, the reward model, or the dynamical model.
+        """
+        (p_mean, a_mean, h_mean), (p_std, a_std, h_std) = means, stds
+        if self.maximin:
+            a_mean, a_std = reverse_gradient(a_mean), reverse_gradient(a_std)
+            if self.hallucinate_antagonist:
+                h_mean, h_std = reverse_gradient(h_mean), reverse_gradient(h_std)
+        elif self.protagonist:
             a_mean, a_std = a_mean.detach(), a_std.detach()
             if self.hallucinate_antagonist:
                 h_mean, h_std = h_mean.detach(), h_std.detach()
@@ -52,8 +72,7 @@ class SplitPolicy(AdversarialPolicy):
                 h_mean, h_std = h_mean.detach(), h_std.detach()
         else:
             raise NotImplementedError
-
-        return self.stack_policies((p_mean, a_mean, h_mean), (p_std, a_std, h_std))
+        return (p_mean, a_mean, h_mean), (p_std, a_std, h_std)
 
     @classmethod
     def default(
@@ -63,6 +82,7 @@ class SplitPolicy(AdversarialPolicy):
         protagonist_policy=None,
         antagonist_policy=None,
         hallucination_policy=None,
+        diagonal_scale=False,
         *args,
         **kwargs,
     ):
@@ -88,6 +108,7 @@ class SplitPolicy(AdversarialPolicy):
             antagonist_policy=antagonist_policy,
             hallucination_policy=hallucination_policy,
             hallucinate_protagonist=hallucinate_protagonist,
+            diagonal_scale=diagonal_scale,
         )
 
     @classmethod
@@ -99,3 +120,145 @@ class SplitPolicy(AdversarialPolicy):
             *args,
             **kwargs,
         )
+
+
+class FusedSplitPolicy(SplitPolicy):
+    """Split policy whose members are evaluated by a single grouped network.
+
+    The protagonist, antagonist, and hallucination MLPs are stacked into a
+    `GroupedGaussianNN', hence a forward pass computes the three members with one
+    batched matmul per layer and returns the diagonal std without building the
+    scale_tril of each member.
+
+    When a member is replaced by an external policy, e.g., a protagonist shared with
+    another agent, the external policy is evaluated on its own and the output of
+    its group is ignored. The grouped network keeps its parameters, hence the
+    optimizers built before the replacement still hold the parameters of the
+    policy.
+
+    Parameters
+    ----------
+    protagonist_dim_action: Tuple[int].
+        Dimension of protagonist actions.
+    antagonist_dim_action: Tuple[int].
+        Dimension of antagonist actions.
+    hallucination_dim_action: Tuple[int].
+        Dimension of hallucination actions.
+    layers: Tuple[int].
+        Width of the hidden layers of each member.
+    non_linearity: str.
+        Name of the non-linearity of the hidden layers.
+    squashed_output: bool.
+        If True, the means are squashed with a tanh.
+    """
+
+    names = ("protagonist", "antagonist", "hallucination")
+
+    def __init__(
+        self,
+        dim_state,
+        dim_action,
+        protagonist_dim_action,
+        antagonist_dim_action,
+        hallucination_dim_action,
+        layers=(32, 32),
+        non_linearity="Tanh",
+        squashed_output=True,
+        hallucinate_protagonist=True,
+        diagonal_scale=False,
+        *args,
+        **kwargs,
+    ):
+        dims = (protagonist_dim_action, antagonist_dim_action, hallucination_dim_action)
+        grouped_nn = GroupedGaussianNN(
+            in_dim=dim_state[0],
+            out_dims=[dim[0] for dim in dims],
+            layers=layers,
+            non_linearity=non_linearity,
+            squashed_output=squashed_output,
+        )
+        members = [
+            GroupedPolicyMember(
+                grouped_nn,
+                group,
+                diagonal_scale=diagonal_scale,
+                dim_state=dim_state,
+                dim_action=dim,
+            )
+            for group, dim in enumerate(dims)
+        ]
+        super().__init__(
+            dim_state=dim_state,
+            dim_action=dim_action,
+            protagonist_policy=members[0],
+            antagonist_policy=members[1],
+            hallucination_policy=members[2],
+            hallucinate_protagonist=hallucinate_protagonist,
+            diagonal_scale=diagonal_scale,
+            *args,
+            **kwargs,
+        )
+        self.grouped_nn = grouped_nn
+        self.fused_names = list(self.names)
+
+    def _unfuse(self, name):
+        """Ignore the group of a member in the output of the grouped network."""
+        if name in self.fused_names:
+            self.fused_names.remove(name)
+
+    def set_protagonist_policy(self, new_policy):
+        """Set protagonist policy."""
+        if new_policy is not self._protagonist_policy:
+            self._unfuse("protagonist")
+        super().set_protagonist_policy(new_policy)
+
+    def set_antagonist_policy(self, new_policy):
+        """Set antagonist policy."""
+        if new_policy is not self._antagonist_policy:
+            self._unfuse("antagonist")
+        super().set_antagonist_policy(new_policy)
+
+    def set_hallucination_policy(self, new_policy):
+        """Set hallucination policy."""
+        if new_policy is not self._hallucination_policy:
+            self._unfuse("hallucination")
+        super().set_hallucination_policy(new_policy)
+
+    def forward(self, state):
+        """Forward compute the policy."""
+        means, stds = [], []
+        if self.fused_names:
+            fused_means, fused_stds = self.grouped_nn(state)
+        for name in self.names:
+            if name in self.fused_names:
+                group = self.names.index(name)
+                means.append(fused_means[group])
+                stds.append(fused_stds[group])
+            else:
+                mean, scale_tril = getattr(self, f"{name}_policy")(state)
+                means.append(mean)
+                stds.append(get_diagonal_scale(mean, scale_tril))
+        if self.deterministic:
+            stds = [torch.zeros_like(std) for std in stds]
+
+        return self.stack_policies(*self.detach_inactive(means, stds))
+
+    @classmethod
+    def default(
+        cls,
+        environment,
+        hallucinate_protagonist=True,
+        diagonal_scale=False,
+        *args,
+        **kwargs,
+    ):
+        """See `NNPolicy.default'."""
+        return cls(
+            dim_state=environment.dim_state,
+            dim_action=environment.dim_action,
+            protagonist_dim_action=environment.protagonist_dim_action,
+            antagonist_dim_action=environment.antagonist_dim_action,
+            hallucination_dim_action=environment.dim_state,
+            hallucinate_protagonist=hallucinate_protagonist,
+            diagonal_scale=diagonal_scale,
+        )
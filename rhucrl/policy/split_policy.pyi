@@ -1,11 +1,13 @@
 """Python Script Template."""
-from typing import Any, Type, TypeVar
+from typing import Any, List, Tuple, Type, TypeVar
 
 from rllib.policy import AbstractPolicy
+from torch import Tensor
 
 from rhucrl.environment import AdversarialEnv
 
 from .adversarial_policy import AdversarialPolicy
+from .grouped_network import GroupedGaussianNN
 
 T = TypeVar("T", bound="SplitPolicy")
 
@@ -19,6 +21,9 @@ class SplitPolicy(AdversarialPolicy):
     def hallucinate_protagonist(self) -> bool: ...
     @property
     def hallucinate_antagonist(self) -> bool: ...
+    def detach_inactive(
+        self, means: Tuple[Tensor, ...], stds: Tuple[Tensor, ...]
+    ) -> Tuple[Tuple[Tensor, ...], Tuple[Tensor, ...]]: ...
     @classmethod
     def default(
         cls: Type[T],
@@ -32,3 +37,26 @@ class SplitPolicy(AdversarialPolicy):
     def from_adversarial_policy(
         cls: Type[T], adversarial_policy: AdversarialPolicy, *args: Any, **kwargs: Any
     ) -> T: ...
+
+class FusedSplitPolicy(SplitPolicy):
+    """Split policy whose members are evaluated by a single grouped network."""
+
+    names: Tuple[str, ...]
+    grouped_nn: GroupedGaussianNN
+    fused_names: List[str]
+    def __init__(
+        self,
+        dim_state: Tuple[int],
+        dim_action: Tuple[int],
+        protagonist_dim_action: Tuple[int],
+        antagonist_dim_action: Tuple[int],
+        hallucination_dim_action: Tuple[int],
+        layers: Tuple[int, ...] = ...,
+        non_linearity: str = ...,
+        squashed_output: bool = ...,
+        hallucinate_protagonist: bool = ...,
+        diagonal_scale: bool = ...,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None: ...
+    def _unfuse(self, name: str) -> None: ...
@@ -1,4 +1,5 @@
 """Python Script Template."""
+import torch
 
 
 class ProtagonistMode(object):
@@ -18,8 +19,54 @@ class ProtagonistMode(object):
         self.policy.protagonist = self.old
 
 
+class MaxiMinMode(object):
+    """Context Manager to optimize protagonist and antagonist with a single loss.
+
+    In maxi-min mode, the policy does not detach the outputs of any player. Instead,
+    it reverses the gradient of the antagonist outputs, see `SplitPolicy'.
+    """
+
+    def __init__(self, policy):
+        self.policy = policy
+        self.old = self.policy.maximin
+
+    def __enter__(self):
+        """Enter into a MaxiMin Context."""
+        self.policy.maximin = True
+
+    def __exit__(self, *args):
+        """Exit the MaxiMin Context."""
+        self.policy.maximin = self.old
+
+
+class GradientReversal(torch.autograd.Function):
+    """Identity in the forward pass that negates the gradient in the backward pass."""
+
+    @staticmethod
+    def forward(ctx, x):
+        """Return the input."""
+        return x.view_as(x)
+
+    @staticmethod
+    def backward(ctx, grad_output):
+        """Return the negated gradient."""
+        return -grad_output
+
+
+def reverse_gradient(x):
+    """Reverse the gradient that flows through x."""
+    return GradientReversal.apply(x)
+
+
 class AntagonistMode(ProtagonistMode):
     """Context Manager to set the policy to be protagonist."""
 
     def __init__(self, policy, protagonist=False):
         super().__init__(policy, protagonist=protagonist)
+
+
+def get_diagonal_scale(mean, scale):
+    """Get the diagonal of the scale, that is either a scale_tril or a diagonal."""
+    if scale.shape == mean.shape:
+        return scale
+    return scale.diagonal(dim1=-1, dim2=-2)
@@ -1,6 +1,9 @@
 """Python Script Template."""
 from typing import Any
 
+import torch
+from torch import Tensor
+
 from rhucrl.policy.adversarial_policy import AdversarialPolicy
 
 class ProtagonistMode(object):
@@ -12,3 +15,19 @@ class ProtagonistMode(object):
     def __exit__(self, *args: Any, **kwargs: Any) -> None: ...
 
 class AntagonistMode(ProtagonistMode): ...
+
+class MaxiMinMode(object):
+    policy: AdversarialPolicy
+    old: bool
+    def __init__(self, policy: AdversarialPolicy) -> None: ...
+    def __enter__(self) -> None: ...
+    def __exit__(self, *args: Any, **kwargs: Any) -> None: ...
+
+class GradientReversal(torch.autograd.Function):
+    @staticmethod
+    def forward(ctx: Any, x: Tensor) -> Tensor: ...
+    @staticmethod
+    def backward(ctx: Any, grad_output: Tensor) -> Tensor: ...
+
+def reverse_gradient(x: Tensor) -> Tensor: ...
+def get_diagonal_scale(mean: Tensor, scale: Tensor) -> Tensor: ...
@@ -0,0 +1,317 @@
+"""Asynchronous actor-learner training of adversarial agents."""
+import threading
+import time
+from contextlib import contextmanager
+from copy import copy
+
+from rllib.util.neural_networks.utilities import deep_copy_module
+
+from rhucrl.utilities.rollout_workers import step_environment
+
+
+class BufferedLogger(object):
+    """Logger of the actor that buffers the updates until they are flushed."""
+
+    def __init__(self):
+        self.updates = []
+
+    def update(self, **kwargs):
+        """Buffer a logger update."""
+        self.updates.append(kwargs)
+
+    def flush(self, logger):
+        """Send the buffered updates to a logger."""
+        for kwargs in self.updates:
+            logger.update(**kwargs)
+        self.updates = []
+
+
+class AsyncActorLearner(object):
+    """Train an agent with an actor thread and a learner thread.
+
+    The actor steps the environment with a shallow copy of the agent, whose policy is
+    a copy of `agent.policy' and whose logger buffers the updates. Hence the actions
+    go through `agent.act()', e.g., with its exploration, without touching the agent.
+    The observations are buffered and sent to `agent.observe()' whenever the agent is
+    free. The agent does not learn inside `observe()' and `end_episode()', as its
+    `train_frequency' and `num_rollouts' are zero while they run. Instead, each time
+    the serial schedule of the agent would learn, an update is scheduled, and the
+    learner calls `agent.learn()', e.g., `RHUCRLAgent.learn()' fits the model, the
+    protagonist and the antagonist. Hence the number of updates matches the serial
+    training loop.
+
+    A single lock guards the agent and its logger. The learner holds it during
+    `learn()' and the actor only tries to take it between steps, hence the
+    environment steps overlap with the gradient computations. The learner waits on a
+    condition of the same lock for new scheduled updates.
+
+    The actor shares the modules of the agent other than the policy, e.g., the
+    dynamical model, which the learner updates without the actor holding the lock.
+    Hence agents that plan with their model when they act are not supported.
+
+    Parameters
+    ----------
+    agent: AbstractAgent.
+        Agent to train.
+    environment: AdversarialEnv.
+        Environment of the actor.
+    max_steps: int.
+        Maximum number of steps per episode.
+    max_policy_lag: int.
+        Maximum number of learner updates the actor policy may lag behind. The actor
+        refreshes its copy whenever the agent is free and waits for it once the lag
+        exceeds `max_policy_lag'.
+    min_steps_per_update: int, optional.
+        If given, an update is scheduled every `min_steps_per_update' observed steps
+        instead of following the schedule of the agent.
+    print_frequency: int.
+        Print agent stats frequency.
+    """
+
+    def __init__(
+        self,
+        agent,
+        environment,
+        max_steps=1000,
+        max_policy_lag=1,
+        min_steps_per_update=None,
+        print_frequency=0,
+    ):
+        if getattr(agent, "plan_horizon", 0) > 0:
+            raise NotImplementedError("The actor does not snapshot the planning model.")
+        if min_steps_per_update is not None and min_steps_per_update < 1:
+            raise ValueError("The learner needs at least one new step per update.")
+        self.agent = agent
+        self.environment = environment
+        self.max_steps = max_steps
+        self.max_policy_lag = max_policy_lag
+        self.min_steps_per_update = min_steps_per_update
+        self.print_frequency = print_frequency
+
+        self.actor_policy = deep_copy_module(agent.policy)
+        self.actor_policy.eval()
+        self.actor_logger = BufferedLogger()
+        self.actor = copy(agent)
+        self.lock = threading.RLock()
+        self._observations = []
+        self._new_data = threading.Condition(self.lock)
+        self._stop = threading.Event()
+        self._error = None
+        self.reset_counters()
+
+    @contextmanager
+    def _serial_learning_disabled(self):
+        """Disable the learning of the agent inside `observe()' and `end_episode()'."""
+        schedule = self.agent.train_frequency, self.agent.num_rollouts
+        self.agent.train_frequency, self.agent.num_rollouts = 0, 0
+        try:
+            yield
+        finally:
+            self.agent.train_frequency, self.agent.num_rollouts = schedule
+
+    def _schedule_update(self, serial):
+        """Schedule an update if the serial training loop would learn now."""
+        if self.min_steps_per_update is None:
+            scheduled = serial
+        else:
+            scheduled = self.num_steps % self.min_steps_per_update == 0
+        if scheduled:
+            self.num_scheduled_updates += 1
+            self._new_data.notify_all()
+
+    def _observe(self, observation):
+        """Send an observation to the agent and schedule an update.
+
+        The caller must hold the lock.
+        """
+        with self._serial_learning_disabled():
+            self.agent.observe(observation)
+        self.num_steps += 1
+        self._schedule_update(self.agent.train_at_observe)
+
+    def _end_episode(self):
+        """End the episode of the agent and schedule an update.
+
+        The caller must hold the lock.
+        """
+        if self.min_steps_per_update is None:
+            self._schedule_update(self.agent.train_at_end_episode)
+        with self._serial_learning_disabled():
+            self.agent.end_episode()
+
+    def reset_counters(self):
+        """Reset the throughput counters."""
+        self.num_steps = 0
+        self.num_updates = 0
+        self.num_refreshes = 0
+        self.num_scheduled_updates = 0
+        self.policy_version = 0
+        self.total_policy_lag = 0
+        self.actor_wait_time = 0.0
+        self.learner_idle_time = 0.0
+        self.start_time = time.perf_counter()
+
+    def statistics(self):
+        """Return the throughput and staleness statistics to log."""
+        elapsed = max(time.perf_counter() - self.start_time, 1e-9)
+        return {
+            "async_steps_per_second": self.num_steps / elapsed,
+            "async_updates_per_second": self.num_updates / elapsed,
+            "async_policy_refreshes": self.num_refreshes,
+            "async_mean_policy_lag": self.total_policy_lag / max(self.num_steps, 1),
+            "async_actor_wait_time": self.actor_wait_time,
+            "async_learner_idle_time": self.learner_idle_time,
+        }
+
+    def _sync(self):
+        """Send the buffered data to the agent and refresh the actor.
+
+        The caller must hold the lock.
+        """
+        for observation in self._observations:
+            self._observe(observation)
+        self._observations = []
+        self.actor_logger.flush(self.agent.logger)
+
+        if self.policy_version < self.num_updates:
+            self.actor_policy.load_state_dict(self.agent.policy.state_dict())
+            self.policy_version = self.num_updates
+            self.num_refreshes += 1
+        self.actor.__dict__.update(self.agent.__dict__)
+        self.actor.policy = self.actor_policy
+        self.actor.logger = self.actor_logger
+
+    def _try_sync(self):
+        """Sync with the agent if it is free, or wait if the policy lags too much."""
+        if self.num_updates - self.policy_version > self.max_policy_lag:
+            start = time.perf_counter()
+            self.lock.acquire()
+            self.actor_wait_time += time.perf_counter() - start
+        elif not self.lock.acquire(blocking=False):
+            return
+        try:
+            self._sync()
+        finally:
+            self.lock.release()
+
+    def _step(self, state):
+        """Step the environment with the actor and buffer the transition."""
+        self._try_sync()
+        self.total_policy_lag += self.num_updates - self.policy_version
+        observation, next_state, done = step_environment(
+            self.environment, self.actor, state
+        )
+        self._observations.append(observation)
+        return next_state, done
+
+    def _actor(self, num_episodes):
+        """Roll out the episodes."""
+        try:
+            for episode in range(num_episodes):
+                with self.lock:
+                    self.agent.start_episode()
+                    self._sync()
+                state, done, steps = self.environment.reset(), False, 0
+                while not done and steps < self.max_steps:
+                    if self._stop.is_set():
+                        return
+                    state, done = self._step(state)
+                    steps += 1
+                with self.lock:
+                    self._sync()
+                    self._end_episode()
+                    self.agent.logger.update(**self.statistics())
+                    if self.print_frequency and episode % self.print_frequency == 0:
+                        print(self.agent)
+        except Exception as error:
+            self._error = error
+        finally:
+            self._stop_learner()
+
+    def _stop_learner(self):
+        """Let the learner finish the scheduled updates and stop."""
+        with self.lock:
+            self._stop.set()
+            self._new_data.notify_all()
+
+    def _learner(self):
+        """Run the scheduled updates until the actor finishes."""
+        try:
+            while True:
+                with self.lock:
+                    start = time.perf_counter()
+                    while (
+                        self.num_updates >= self.num_scheduled_updates
+                        and not self._stop.is_set()
+                    ):
+                        self._new_data.wait()
+                    self.learner_idle_time += time.perf_counter() - start
+                    if (
+                        self._error is not None
+                        or self.num_updates >= self.num_scheduled_updates
+                    ):
+                        return
+                    self.agent.learn()
+                    self.num_updates += 1
+        except Exception as error:
+            self._error = error
+            self._stop.set()
+
+    def run(self, num_episodes):
+        """Train the agent during `num_episodes' episodes of the actor."""
+        self._stop.clear()
+        self.reset_counters()
+        self.actor_policy.load_state_dict(self.agent.policy.state_dict())
+
+        self.agent.train()
+        learner = threading.Thread(target=self._learner, daemon=True)
+        learner.start()
+        try:
+            self._actor(num_episodes)
+        finally:
+            self._stop_learner()
+            learner.join()
+        if self._error is not None:
+            raise self._error
+
+
+def train_agent_async(
+    agent,
+    environment,
+    num_episodes,
+    max_steps,
+    max_policy_lag=1,
+    min_steps_per_update=None,
+    print_frequency=0,
+):
+    """Train an agent with an asynchronous actor and learner.
+
+    See `AsyncActorLearner' for the meaning of the staleness bounds.
+
+    Parameters
+    ----------
+    agent: AbstractAgent.
+        Agent to train.
+    environment: AdversarialEnv.
+        Environment of the actor.
+    num_episodes: int.
+        Number of episodes to train.
+    max_steps: int.
+        Maximum number of steps per episode.
+    max_policy_lag: int.
+        Maximum number of learner updates the actor policy may lag behind.
+    min_steps_per_update: int, optional.
+        Number of observed steps between two learner updates. By default, the
+        updates follow the training schedule of the agent.
+    print_frequency: int.
+        Print agent stats frequency.
+    """
+    AsyncActorLearner(
+        agent,
+        environment,
+        max_steps=max_steps,
+        max_policy_lag=max_policy_lag,
+        min_steps_per_update=min_steps_per_update,
+        print_frequency=print_frequency,
+    ).run(num_episodes)
+    agent.end_interaction()
@@ -0,0 +1,73 @@
+import threading
+from typing import Any, ContextManager, Dict, List, Optional, Tuple
+
+from rllib.agent import AbstractAgent
+from rllib.dataset.datatypes import Observation
+from rllib.policy import AbstractPolicy
+from rllib.util.logger import Logger
+from torch import Tensor
+
+from rhucrl.environment.adversarial_environment import AdversarialEnv
+
+class BufferedLogger(object):
+    updates: List[Dict[str, Any]]
+    def __init__(self) -> None: ...
+    def update(self, **kwargs: Any) -> None: ...
+    def flush(self, logger: Logger) -> None: ...
+
+class AsyncActorLearner(object):
+    agent: AbstractAgent
+    environment: AdversarialEnv
+    max_steps: int
+    max_policy_lag: int
+    min_steps_per_update: Optional[int]
+    print_frequency: int
+    actor_policy: AbstractPolicy
+    actor_logger: BufferedLogger
+    actor: AbstractAgent
+    lock: threading.RLock
+    _observations: List[Observation]
+    _new_data: threading.Condition
+    _stop: threading.Event
+    _error: Optional[Exception]
+    num_steps: int
+    num_updates: int
+    num_refreshes: int
+    num_scheduled_updates: int
+    policy_version: int
+    total_policy_lag: int
+    actor_wait_time: float
+    learner_idle_time: float
+    start_time: float
+    def __init__(
+        self,
+        agent: AbstractAgent,
+        environment: AdversarialEnv,
+        max_steps: int = ...,
+        max_policy_lag: int = ...,
+        min_steps_per_update: Optional[int] = ...,
+        print_frequency: int = ...,
+    ) -> None: ...
+    def _serial_learning_disabled(self) -> ContextManager[None]: ...
+    def _schedule_update(self, serial: bool) -> None: ...
+    def _observe(self, observation: Observation) -> None: ...
+    def _end_episode(self) -> None: ...
+    def reset_counters(self) -> None: ...
+    def statistics(self) -> Dict[str, float]: ...
+    def _sync(self) -> None: ...
+    def _try_sync(self) -> None: ...
+    def _step(self, state: Tensor) -> Tuple[Tensor, bool]: ...
+    def _actor(self, num_episodes: int) -> None: ...
+    def _stop_learner(self) -> None: ...
+    def _learner(self) -> None: ...
+    def run(self, num_episodes: int) -> None: ...
+
+def train_agent_async(
+    agent: AbstractAgent,
+    environment: AdversarialEnv,
+    num_episodes: int,
+    max_steps: int,
+    max_policy_lag: int = ...,
+    min_steps_per_update: Optional[int] = ...,
+    print_frequency: int = ...,
+) -> None: ...
@@ -0,0 +1,51 @@
+"""Memory proxy that records the sampled batches to replay them later."""
+
+
+class BatchRecorder(object):
+    """Record the batches sampled from a memory and replay them in the same order.
+
+    While recording, `sample_batch' samples from the memory and stores the batch.
+    While replaying, `sample_batch' returns the stored batches cyclically. Any other
+    attribute is read from the memory. If a prediction cache is given, only the
+    batches sampled while the cache is active are recorded, e.g., not the ones of
+    model learning, and its batch is set to the index of the returned batch, so
+    that the predictions on a batch are keyed on it.
+
+    Parameters
+    ----------
+    memory: ExperienceReplay.
+        Memory to sample from.
+    prediction_cache: PredictionCache, optional.
+        Cache whose batch is set on each sample.
+    """
+
+    def __init__(self, memory, prediction_cache=None):
+        self.memory = memory
+        self.prediction_cache = prediction_cache
+        self.batches = []
+        self.replay = False
+        self._replay_idx = 0
+
+    def __getattr__(self, name):
+        """Get attribute of the memory."""
+        if name in ["memory", "prediction_cache"]:
+            raise AttributeError(name)
+        return getattr(self.memory, name)
+
+    def sample_batch(self, batch_size):
+        """Sample a batch, or replay the next recorded one."""
+        if self.prediction_cache is not None and not self.prediction_cache.active:
+            return self.memory.sample_batch(batch_size)
+        if self.replay and len(self.batches) > 0:
+            index = self._replay_idx % len(self.batches)
+            self._replay_idx += 1
+            observation, *other = self.batches[index]
+            batch = (observation.clone(), *other)
+        else:
+            index = len(self.batches)
+            batch = self.memory.sample_batch(batch_size)
+            observation, *other = batch
+            self.batches.append((observation.clone(), *other))
+        if self.prediction_cache is not None:
+            self.prediction_cache.batch = index
+        return batch
@@ -0,0 +1,19 @@
+from typing import Any, List, Optional, Tuple
+
+from rllib.dataset.experience_replay import ExperienceReplay
+
+from rhucrl.model.prediction_cache import PredictionCache
+
+class BatchRecorder(object):
+    memory: ExperienceReplay
+    prediction_cache: Optional[PredictionCache]
+    batches: List[Tuple[Any, ...]]
+    replay: bool
+    _replay_idx: int
+    def __init__(
+        self,
+        memory: ExperienceReplay,
+        prediction_cache: Optional[PredictionCache] = ...,
+    ) -> None: ...
+    def __getattr__(self, name: str) -> Any: ...
+    def sample_batch(self, batch_size: int) -> Tuple[Any, ...]: ...
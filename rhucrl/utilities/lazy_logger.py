@@ -0,0 +1,77 @@
+"""Logger proxy that creates its directory on first use."""
+from copy import deepcopy
+
+from rllib.util.logger import Logger
+
+
+class LazyLogger(object):
+    """Proxy of a `Logger' that is only created when it is first used.
+
+    Creating a `Logger' creates its log directory, hence agents that never log,
+    e.g., members of a population that are never sampled, do not touch the file
+    system. Copies and pickles of the proxy do not create the logger either.
+
+    Parameters
+    ----------
+    name: str.
+        Name of the logger.
+    kwargs: dict.
+        Keyword arguments of the logger.
+    """
+
+    def __init__(self, name, **kwargs):
+        self.name = name
+        self.kwargs = kwargs
+        self._logger = None
+
+    @property
+    def logger(self):
+        """Get the logger, creating it if it does not exist."""
+        if self.__dict__.get("_logger") is None:
+            self._logger = Logger(self.name, **self.kwargs)
+        return self._logger
+
+    def __getattr__(self, name):
+        """Get attribute of the logger.
+
+        Private and special attributes, e.g., `__deepcopy__', are never forwarded.
+        """
+        if name.startswith("_") or name in ["name", "kwargs"]:
+            raise AttributeError(name)
+        return getattr(self.logger, name)
+
+    def __deepcopy__(self, memo):
+        """Copy the proxy, and the logger only if it exists."""
+        new = type(self).__new__(type(self))
+        memo[id(self)] = new
+        new.__dict__.update(deepcopy(self.__dict__, memo))
+        return new
+
+    def __getstate__(self):
+        """Get the state of the proxy, and of the logger only if it exists."""
+        return self.__dict__.copy()
+
+    def __setstate__(self, state):
+        """Set the state of the proxy."""
+        self.__dict__.update(state)
+
+    def __iter__(self):
+        """Iterate over the logger statistics."""
+        return iter(self.logger)
+
+    def __len__(self):
+        """Return the number of logged episodes."""
+        return len(self.logger)
+
+    def __getitem__(self, index):
+        """Get the statistics of an episode."""
+        return self.logger[index]
+
+    def __str__(self):
+        """Return the string of the logger."""
+        return str(self.logger)
+
+    def delete_directory(self):
+        """Delete the log directory, if it was created."""
+        if self.__dict__.get("_logger") is not None:
+            self._logger.delete_directory()
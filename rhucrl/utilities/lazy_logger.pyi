@@ -0,0 +1,19 @@
+from typing import Any, Dict, Iterator, Optional
+
+from rllib.util.logger import Logger
+
+class LazyLogger(object):
+    name: str
+    kwargs: Dict[str, Any]
+    _logger: Optional[Logger]
+    def __init__(self, name: str, **kwargs: Any) -> None: ...
+    @property
+    def logger(self) -> Logger: ...
+    def __getattr__(self, name: str) -> Any: ...
+    def __deepcopy__(self, memo: Dict[int, Any]) -> LazyLogger: ...
+    def __getstate__(self) -> Dict[str, Any]: ...
+    def __setstate__(self, state: Dict[str, Any]) -> None: ...
+    def __iter__(self) -> Iterator[Dict[str, float]]: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, index: int) -> Dict[str, float]: ...
+    def delete_directory(self) -> None: ...
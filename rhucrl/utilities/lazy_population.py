@@ -0,0 +1,68 @@
+"""Population of agents that are copied from a template on first access."""
+from collections.abc import Sequence
+
+
+class LazyPopulation(Sequence):
+    """Sequence of agents that are only materialized when they are first accessed.
+
+    Before it is accessed, a member is the template agent: same initial weights and
+    an empty memory. On first access, the factory copies the template into a new
+    agent that is then mutated on its own. The last member to be materialized is
+    the template itself, as no other member needs it afterwards. Hence, the memory
+    grows with the members that are actually sampled and not with the size of the
+    population, and a population of one agent holds no copy.
+    Iterating over the population materializes all the members.
+
+    Parameters
+    ----------
+    template: AbstractAgent.
+        Agent to copy. It must not be mutated until it is a member.
+    size: int.
+        Number of members of the population.
+    factory: Callable[[AbstractAgent, str, bool], AbstractAgent].
+        Function that makes a member from the template, given the name of the member
+        and whether to copy the template.
+    name: str.
+        Name of the population. Member i is named f"{name}-{i}".
+    """
+
+    def __init__(self, template, size, factory, name):
+        self.template = template
+        self.size = size
+        self.factory = factory
+        self.name = name
+        self.members = {}
+
+    def __len__(self):
+        """Return the size of the population."""
+        return self.size
+
+    def __getitem__(self, idx):
+        """Get a member of the population, materializing it if necessary."""
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(self.size))]
+        idx = int(idx)
+        if idx < 0:
+            idx += self.size
+        if not 0 <= idx < self.size:
+            raise IndexError(f"{idx} out of range for population of {self.size}.")
+        if idx not in self.members:
+            last = len(self.members) == self.size - 1
+            self.members[idx] = self.factory(
+                self.template, f"{self.name}-{idx}", copy=not last
+            )
+        return self.members[idx]
+
+    def is_materialized(self, idx):
+        """Return true if the member was already materialized."""
+        return idx in self.members
+
+    @property
+    def template_is_member(self):
+        """Return true if the template was already materialized as a member."""
+        return len(self.members) == self.size
+
+    @property
+    def materialized(self):
+        """Get the materialized members, sorted by index."""
+        return [self.members[idx] for idx in sorted(self.members)]
@@ -0,0 +1,27 @@
+from typing import Callable, Dict, List, Sequence, overload
+
+from rllib.agent import AbstractAgent
+
+class LazyPopulation(Sequence[AbstractAgent]):
+    template: AbstractAgent
+    size: int
+    factory: Callable[[AbstractAgent, str], AbstractAgent]
+    name: str
+    members: Dict[int, AbstractAgent]
+    def __init__(
+        self,
+        template: AbstractAgent,
+        size: int,
+        factory: Callable[[AbstractAgent, str], AbstractAgent],
+        name: str,
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    @overload
+    def __getitem__(self, idx: int) -> AbstractAgent: ...
+    @overload
+    def __getitem__(self, idx: slice) -> List[AbstractAgent]: ...
+    def is_materialized(self, idx: int) -> bool: ...
+    @property
+    def template_is_member(self) -> bool: ...
+    @property
+    def materialized(self) -> List[AbstractAgent]: ...
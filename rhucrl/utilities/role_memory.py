@@ -0,0 +1,105 @@
+"""Role views of a replay memory shared by protagonist and antagonist agents."""
+from copy import copy
+
+import torch
+from rllib.util.utilities import tensor_to_distribution
+
+
+class FakeHallucination(object):
+    """Sample the hallucination actions of a policy for a batch of states.
+
+    Parameters
+    ----------
+    policy: AbstractPolicy.
+        Policy whose actions are [action, hallucination action].
+    dim_action: int.
+        Dimension of the actions without hallucination.
+    """
+
+    def __init__(self, policy, dim_action):
+        self.policy = policy
+        self.dim_action = dim_action
+
+    def __call__(self, state):
+        """Sample the hallucination actions at the states."""
+        with torch.no_grad():
+            action = tensor_to_distribution(self.policy(state)).sample()
+        return action[..., self.dim_action :]
+
+
+class RoleMemoryView(object):
+    """View of a shared memory from the point of view of a player.
+
+    The joint transitions are appended once to the shared memory, hence `append' is
+    a no-op unless the view is the owner of the memory. When sampling, the joint
+    actions are sliced to the player actions, the rewards are multiplied by
+    `reward_sign' and, if given, the fake hallucination actions of the player are
+    sampled for the whole batch.
+    Other attributes are read from the shared memory.
+
+    Parameters
+    ----------
+    memory: ExperienceReplay.
+        Shared memory with the joint transitions.
+    action_indexes: List[int], optional.
+        Indexes of the joint actions that are player actions. If None, all of them.
+    reward_sign: float.
+        Sign of the player rewards.
+    fake_hallucination: Callable[[Tensor], Tensor], optional.
+        Function that samples the hallucination actions of the player.
+    owner: bool.
+        If True, the observations of the player are appended to the memory.
+    """
+
+    def __init__(
+        self,
+        memory,
+        action_indexes=None,
+        reward_sign=1.0,
+        fake_hallucination=None,
+        owner=False,
+    ):
+        self.memory = memory
+        if action_indexes is not None:
+            action_indexes = torch.tensor(action_indexes, dtype=torch.long)
+        self.action_indexes = action_indexes
+        self.reward_sign = reward_sign
+        self.fake_hallucination = fake_hallucination
+        self.owner = owner
+
+    def __getattr__(self, name):
+        """Get attribute of the shared memory."""
+        if name == "memory":
+            raise AttributeError(name)
+        return getattr(self.memory, name)
+
+    def __len__(self):
+        """Return the number of transitions in the shared memory."""
+        return len(self.memory)
+
+    def append(self, observation):
+        """Append the observation if the view is the owner of the memory.
+
+        Otherwise, the joint observation is appended to the shared memory.
+        """
+        if self.owner:
+            self.memory.append(observation)
+
+    def to_role(self, observation):
+        """Get the player observation from a joint observation."""
+        role_observation = copy(observation)
+        if self.action_indexes is not None:
+            role_observation.action = observation.action[..., self.action_indexes]
+        if self.reward_sign != 1.0:
+            role_observation.reward = self.reward_sign * observation.reward
+        if self.fake_hallucination is not None:
+            role_observation.action = torch.cat(
+                (role_observation.action, self.fake_hallucination(observation.state)),
+                dim=-1,
+            )
+        return role_observation
+
+    def sample_batch(self, batch_size):
+        """Sample a batch of player observations."""
+        observation, *other = self.memory.sample_batch(batch_size)
+        return (self.to_role(observation), *other)
@@ -0,0 +1,32 @@
+from typing import Any, Callable, List, Optional, Tuple
+
+from rllib.dataset.datatypes import Observation
+from rllib.dataset.experience_replay import ExperienceReplay
+from rllib.policy import AbstractPolicy
+from torch import Tensor
+
+class FakeHallucination(object):
+    policy: AbstractPolicy
+    dim_action: int
+    def __init__(self, policy: AbstractPolicy, dim_action: int) -> None: ...
+    def __call__(self, state: Tensor) -> Tensor: ...
+
+class RoleMemoryView(object):
+    memory: ExperienceReplay
+    action_indexes: Optional[Tensor]
+    reward_sign: float
+    fake_hallucination: Optional[Callable[[Tensor], Tensor]]
+    owner: bool
+    def __init__(
+        self,
+        memory: ExperienceReplay,
+        action_indexes: Optional[List[int]] = ...,
+        reward_sign: float = ...,
+        fake_hallucination: Optional[Callable[[Tensor], Tensor]] = ...,
+        owner: bool = ...,
+    ) -> None: ...
+    def __getattr__(self, name: str) -> Any: ...
+    def __len__(self) -> int: ...
+    def append(self, observation: Observation) -> None: ...
+    def to_role(self, observation: Observation) -> Observation: ...
+    def sample_batch(self, batch_size: int) -> Tuple[Any, ...]: ...
@@ -0,0 +1,288 @@
+"""Process-pool of rollout workers for adversarial training."""
+import numpy as np
+import torch
+import torch.multiprocessing as mp
+from rllib.dataset.datatypes import Observation
+from rllib.util.training.agent_training import evaluate_agent
+from rllib.util.utilities import get_entropy_and_log_p, set_random_seed
+
+
+def _actor_state(agent):
+    """Get the attributes of an agent that its act logic may read.
+
+    These are the counters, flags, and arrays of the agent, e.g., `total_steps',
+    `exploration_episodes', or the training mode, but not its modules or memory.
+    """
+    return {
+        key: value
+        for key, value in vars(agent).items()
+        if isinstance(value, (bool, int, float, str, np.generic, np.ndarray))
+    }
+
+
+def step_environment(environment, agent, state):
+    """Step the environment with `agent.act()' and return the observation.
+
+    Returns
+    -------
+    observation: Observation.
+        Observation of the transition, with the entropy and the log-probability of
+        the action under `agent.pi'.
+    next_state: np.ndarray.
+        Next state of the environment.
+    done: bool.
+        Flag that indicates the end of the episode.
+    """
+    with torch.no_grad():
+        action = agent.act(state)
+    next_state, reward, done, info = environment.step(action)
+    action = torch.tensor(action, dtype=torch.get_default_dtype())
+    with torch.no_grad():
+        entropy, log_prob_action = get_entropy_and_log_p(
+            agent.pi, action, agent.policy.action_scale
+        )
+    observation = Observation(
+        state=state,
+        action=action,
+        reward=reward,
+        next_state=next_state,
+        done=done,
+        entropy=entropy,
+        log_prob_action=log_prob_action,
+    ).to_torch()
+    return observation, next_state, done
+
+
+def _rollout(environment, agent, max_steps):
+    """Roll out a single episode with `agent.act()' and return the observations."""
+    trajectory = []
+    state = environment.reset()
+    done = False
+    while not done and len(trajectory) < max_steps:
+        observation, state, done = step_environment(environment, agent, state)
+        trajectory.append(observation)
+    return trajectory
+
+
+def _rollout_worker(worker_id, agent_fn, max_steps, seed, task_queue, result_queue):
+    """Roll out episodes until a None task is received.
+
+    Each task holds the players, the attributes, and the policy weights of the
+    learner agent when the episode was requested. The worker agent loads them and
+    acts with `agent.act()'.
+    """
+    torch.set_num_threads(1)
+    agent, environment = agent_fn()
+    agent.logger.delete_directory()
+    set_random_seed(seed + worker_id)
+
+    while True:
+        task = task_queue.get()
+        if task is None:
+            break
+        tag, players, actor_state, policy_state = task
+        if players is not None:
+            agent.set_players(players)
+        vars(agent).update(actor_state)
+        agent.policy.load_state_dict(policy_state)
+        result_queue.put((tag, _rollout(environment, agent, max_steps)))
+    environment.close()
+
+
+class RolloutWorkerPool(object):
+    """Pool of processes that roll out episodes with a copy of a learner agent.
+
+    Each worker builds its own agent and environment by calling `agent_fn', which
+    must return the agent and the AdversarialEnv with its full wrapper stack, and
+    must be picklable. The worker agents act with `agent.act()', hence they keep the
+    exploration and the act logic of the agent. Their logger updates are discarded.
+
+    The learner requests an episode with `request()'. The request holds a snapshot
+    of the players, of the attributes, e.g., the step counters, and of the policy
+    weights of the learner agent. `get()' returns the tag of the request and the list
+    of observations.
+
+    Parameters
+    ----------
+    agent_fn: Callable[[], Tuple[AbstractAgent, AdversarialEnv]].
+        Function that builds the agent and the environment of a worker.
+    num_workers: int.
+        Number of worker processes.
+    max_steps: int.
+        Maximum number of steps per episode.
+    seed: int.
+        Base random seed. Worker i uses seed + i.
+    start_method: str.
+        Multiprocessing start method.
+    """
+
+    def __init__(
+        self, agent_fn, num_workers=2, max_steps=1000, seed=0, start_method="spawn"
+    ):
+        self.num_workers = num_workers
+        self.num_pending = 0
+        context = mp.get_context(start_method)
+        self.task_queue = context.Queue()
+        self.result_queue = context.Queue()
+        self.workers = [
+            context.Process(
+                target=_rollout_worker,
+                args=(
+                    worker_id,
+                    agent_fn,
+                    max_steps,
+                    seed,
+                    self.task_queue,
+                    self.result_queue,
+                ),
+                daemon=True,
+            )
+            for worker_id in range(num_workers)
+        ]
+        for worker in self.workers:
+            worker.start()
+
+    def request(self, agent, players=None, tag=None):
+        """Request an episode played by the current policy of the learner agent.
+
+        If players is not None, the worker agent plays with `set_players(players)'.
+        """
+        policy_state = {
+            key: value.detach().cpu().clone()
+            for key, value in agent.policy.state_dict().items()
+        }
+        self.task_queue.put((tag, players, _actor_state(agent), policy_state))
+        self.num_pending += 1
+
+    def get(self, timeout=None):
+        """Get the tag and the observations of the next finished episode."""
+        if self.num_pending == 0:
+            raise RuntimeError("No episode was requested.")
+        tag, trajectory = self.result_queue.get(timeout=timeout)
+        self.num_pending -= 1
+        return tag, trajectory
+
+    def close(self):
+        """Stop all the workers."""
+        for _ in self.workers:
+            self.task_queue.put(None)
+        for worker in self.workers:
+            worker.join()
+
+    def __enter__(self):
+        """Enter into the pool context."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the pool when exiting the context."""
+        self.close()
+
+
+def train_agent_parallel(
+    agent,
+    agent_fn,
+    num_episodes,
+    max_steps,
+    num_workers=2,
+    max_policy_lag=None,
+    print_frequency=0,
+    seed=0,
+    environment=None,
+    eval_frequency=0,
+    render=False,
+):
+    """Train an agent while the episodes are rolled out by a pool of workers.
+
+    The learner process keeps the agent and its memory. The players of each episode
+    are sampled when the episode is requested, and the learner starts the episode
+    with the same players before it sends the observations to `agent.observe()'.
+    Hence each episode is credited to the players that produced it, e.g., to the
+    sampled RAP antagonist.
+
+    The workers act with the policy of the request, so an episode lags behind the
+    learner by the number of episodes observed while it was in flight. This is
+    harmless for off-policy agents, but on-policy agents, e.g., PPO, learn from
+    slightly stale data. `max_policy_lag' bounds the lag by limiting the number of
+    episodes in flight, and the lag of each episode is logged as `policy_lag'.
+    With max_policy_lag=0 the episodes are on-policy but only one worker is busy.
+
+    Parameters
+    ----------
+    agent: AbstractAgent.
+        Agent to train.
+    agent_fn: Callable[[], Tuple[AbstractAgent, AdversarialEnv]].
+        Function that builds the agent and the environment of a worker.
+    num_episodes: int.
+        Number of episodes to train.
+    max_steps: int.
+        Maximum number of steps per episode.
+    num_workers: int.
+        Number of worker processes.
+    max_policy_lag: int, optional.
+        Maximum number of episodes the policy of an episode may lag behind the
+        learner. By default, it is num_workers - 1.
+    print_frequency: int.
+        Print agent stats frequency.
+    seed: int.
+        Base random seed of the workers.
+    environment: AdversarialEnv, optional.
+        Environment of the learner, where the agent is evaluated.
+    eval_frequency: int.
+        The learner evaluates the agent in `environment' every `eval_frequency'
+        episodes. If 0, the agent is not evaluated.
+    render: bool.
+        Flag that indicates whether to render the evaluation episodes. The training
+        episodes of the workers are never rendered.
+    """
+    if eval_frequency > 0 and environment is None:
+        raise ValueError("The learner needs an environment to evaluate the agent.")
+    if render and eval_frequency == 0:
+        raise NotImplementedError("The rollout workers do not render the episodes.")
+    if getattr(agent, "plan_horizon", 0) > 0:
+        raise NotImplementedError("The workers do not receive the planning model.")
+    if max_policy_lag is None:
+        max_policy_lag = num_workers - 1
+    num_in_flight = min(num_workers, max_policy_lag + 1)
+
+    agent.train()
+    with RolloutWorkerPool(
+        agent_fn, num_workers=num_workers, max_steps=max_steps, seed=seed
+    ) as pool:
+
+        def request(version):
+            players = None
+            if hasattr(agent, "sample_players"):
+                players = agent.sample_players()
+                agent.set_players(players)
+            pool.request(agent, players=players, tag=(players, version))
+
+        num_requested = min(num_in_flight, num_episodes)
+        for _ in range(num_requested):
+            request(0)
+        for episode in range(num_episodes):
+            (players, version), trajectory = pool.get()
+            if players is None:
+                agent.start_episode()
+            else:
+                agent.start_episode(players)
+            for observation in trajectory:
+                agent.observe(observation)
+            agent.end_episode()
+            agent.logger.update(policy_lag=episode - version)
+
+            if num_requested < num_episodes:
+                request(episode + 1)
+                num_requested += 1
+
+            if print_frequency and episode % print_frequency == 0:
+                print(agent)
+            if eval_frequency > 0 and episode % eval_frequency == 0:
+                evaluate_agent(
+                    agent,
+                    environment,
+                    num_episodes=1,
+                    max_steps=max_steps,
+                    render=render,
+                )
+                agent.train()
+    agent.end_interaction()
@@ -13,9 +13,18 @@ from rhucrl.model import HallucinatedModel
 
 
 def wrap_adversarial_environment(
-    environment, wrapper_name, alpha, force_body_names=None
+    environment,
+    wrapper_name,
+    alpha,
+    force_body_names=None,
+    validation="full",
+    validation_frequency=1000,
+    clip_actions=False,
 ):
-    """Wrap environment with an adversarial wrapper."""
+    """Wrap environment with an adversarial wrapper.
+
+    See `AdversarialWrapper.set_validation()' for the validation of the actions.
+    """
     if wrapper_name == "noisy_action":
         environment.add_wrapper(NoisyActionRobustWrapper, alpha=alpha)
     elif wrapper_name == "probabilistic_action":
@@ -30,6 +39,11 @@ def wrap_adversarial_environment(
         )
     else:
         raise NotImplementedError(f"{wrapper_name} not implemented.")
+    environment.env.set_validation(
+        validation=validation,
+        frequency=validation_frequency,
+        clip_actions=clip_actions,
+    )
     return environment
 
 
@@ -12,6 +12,9 @@ def wrap_adversarial_environment(
     wrapper_name: str,
     alpha: float,
     force_body_names: Optional[List[str]] = ...,
+    validation: str = ...,
+    validation_frequency: int = ...,
+    clip_actions: bool = ...,
 ) -> AdversarialEnv: ...
 def get_default_models(
     environment: AdversarialEnv,
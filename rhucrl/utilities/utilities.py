@@ -1,6 +1,10 @@
 """Training utilities helpers."""
+import multiprocessing as mp
+
 import numpy as np
+import torch
 from hucrl.environment.hallucination_wrapper import HallucinationWrapper
+from rllib.agent.fixed_policy_agent import FixedPolicyAgent
 from rllib.util.rollout import rollout_episode
 
 from rhucrl.environment.adversarial_environment import AdversarialEnv
@@ -16,57 +20,123 @@ def change_friction(environment, body_idx, new_friction):
     environment.env.model.geom_friction[body_idx] = new_friction
 
 
-def evaluate_domain_shift(env_args, agent, seed, num_runs):
-    """Evaluate agent on domain shift."""
+def _get_domain_shift_environment(env_args, seed, dim_action):
+    """Get the environment and the nominal mass and friction of the bodies."""
     environment = AdversarialEnv(env_args["name"], seed=seed)
-    if environment.dim_action[0] < agent.policy.dim_action[0]:
+    if environment.dim_action[0] < dim_action[0]:
         environment.add_wrapper(HallucinationWrapper)
-    mass_names = env_args.get("mass_names", [])
-    friction_names = env_args.get("friction_names", [])
-    size = len(mass_names) + len(friction_names)
+    model = environment.env.model
 
     mass_names = {
         name: (
-            environment.env.model.body_names.index(name),
-            environment.env.model.body_mass[
-                environment.env.model.body_names.index(name)
-            ],
+            model.body_names.index(name),
+            model.body_mass[model.body_names.index(name)],
         )
-        for name in mass_names
+        for name in env_args.get("mass_names", [])
     }
     friction_names = {
         name: (
-            environment.env.model.body_names.index(name),
-            environment.env.model.geom_friction[
-                environment.env.model.body_names.index(name)
-            ],
+            model.body_names.index(name),
+            model.geom_friction[model.body_names.index(name)],
         )
-        for name in friction_names
+        for name in env_args.get("friction_names", [])
     }
+    return environment, mass_names, friction_names
+
+
+def get_domain_shift_grid(env_args):
+    """Get the grid of relative mass and friction changes.
+
+    Each row has one relative change per body in mass_names and friction_names.
+    """
+    size = len(env_args.get("mass_names", [])) + len(env_args.get("friction_names", []))
     if env_args["name"] == "MBSwimmer-v0":
         k = np.linspace(-0.5, 1, 7)
     else:
         k = np.linspace(-1, 1, num=11)
-    for values in np.array(np.meshgrid(*np.tile(k, size).reshape(size, -1))).T.reshape(
+    return np.array(np.meshgrid(*np.tile(k, size).reshape(size, -1))).T.reshape(
         -1, size
-    ):
-        for i in range(num_runs):
-            # Change mass.
-            for i, (name, (idx, base_mass)) in enumerate(mass_names.items()):
-                new_mass = base_mass * (1 + values[i] + 0.01)
-                change_mass(environment, body_idx=idx, new_mass=new_mass)
-                agent.logger.update(**{f"mass-change-{i}": new_mass})
+    )
+
+
+def _change_domain(environment, agent, mass_names, friction_names, values):
+    """Change the mass and friction of the bodies and log the new values."""
+    # Change mass.
+    for i, (name, (idx, base_mass)) in enumerate(mass_names.items()):
+        new_mass = base_mass * (1 + values[i] + 0.01)
+        change_mass(environment, body_idx=idx, new_mass=new_mass)
+        agent.logger.update(**{f"mass-change-{i}": new_mass})
+
+    # Change friction.
+    for i, (name, (idx, base_friction)) in enumerate(friction_names.items()):
+        new_friction = base_friction * (1 + values[len(mass_names) + i] + 0.01)
+
+        change_friction(environment, body_idx=idx, new_friction=new_friction)
+        agent.logger.update(**{f"friction-change-{i}": new_friction})
+
+
+def evaluate_domain_shift(env_args, agent, seed, num_runs):
+    """Evaluate agent on domain shift."""
+    environment, mass_names, friction_names = _get_domain_shift_environment(
+        env_args, seed=seed, dim_action=agent.policy.dim_action
+    )
+    for values in get_domain_shift_grid(env_args):
+        for _ in range(num_runs):
+            _change_domain(environment, agent, mass_names, friction_names, values)
+            rollout_episode(
+                agent=agent,
+                environment=environment,
+                max_steps=env_args["max_steps"],
+                render=False,
+            )
 
-            # Change friction.
-            for i, (name, (idx, base_friction)) in enumerate(friction_names.items()):
-                new_friction = base_friction * (1 + values[len(mass_names) + i] + 0.01)
 
-                change_friction(environment, body_idx=idx, new_friction=new_friction)
-                agent.logger.update(**{f"friction-change-{i}": new_friction})
+def _evaluate_domain_shift_shard(env_args, policy, seed, num_runs, grid_points):
+    """Evaluate a policy on a subset of the grid points in a worker process."""
+    torch.set_num_threads(1)
+    grid = get_domain_shift_grid(env_args)
+    environment, mass_names, friction_names = _get_domain_shift_environment(
+        env_args, seed=seed, dim_action=policy.dim_action
+    )
+    agent = FixedPolicyAgent.default(environment, policy=policy)
 
+    statistics = []
+    for grid_point in grid_points:
+        for _ in range(num_runs):
+            _change_domain(
+                environment, agent, mass_names, friction_names, grid[grid_point]
+            )
             rollout_episode(
                 agent=agent,
                 environment=environment,
                 max_steps=env_args["max_steps"],
                 render=False,
             )
+            statistics.append(agent.logger.statistics[-1])
+    agent.logger.delete_directory()
+    return statistics
+
+
+def evaluate_domain_shift_parallel(env_args, policy, seed, num_runs, num_workers=2):
+    """Evaluate a policy on domain shift with a pool of worker processes.
+
+    The grid points are split into `num_workers' shards. Each worker builds its own
+    environment, hence its own MuJoCo model, and worker i uses seed + i.
+
+    Returns
+    -------
+    statistics: List[dict].
+        Statistics of each episode, in the order of `evaluate_domain_shift', with the
+        same keys as the statistics that it logs, e.g., `mass-change-0'.
+    """
+    grid_points = np.arange(len(get_domain_shift_grid(env_args)))
+    shards = [
+        (env_args, policy, seed + i, num_runs, shard)
+        for i, shard in enumerate(np.array_split(grid_points, num_workers))
+        if len(shard)
+    ]
+    with mp.get_context("spawn").Pool(len(shards)) as pool:
+        results = pool.starmap(_evaluate_domain_shift_shard, shards)
+
+    # The shards are contiguous, hence concatenating them keeps the grid order.
+    return [episode for shard_statistics in results for episode in shard_statistics]
@@ -0,0 +1 @@
+"""Python Script Template."""
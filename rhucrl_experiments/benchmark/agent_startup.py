@@ -0,0 +1,48 @@
+"""Benchmark the construction time of adversarial agents with large populations."""
+import argparse
+import os
+import time
+
+from rhucrl.agent import RAPAgent
+from rhucrl.environment.adversarial_environment import AdversarialEnv
+from rhucrl.environment.wrappers import AdversarialPendulumWrapper
+
+
+def count_directories(path="runs"):
+    """Count the directories under path."""
+    return sum(len(dirs) for _, dirs, _ in os.walk(path))
+
+
+def main(args):
+    """Time the construction of RAP agents with an increasing number of antagonists."""
+    environment = AdversarialEnv(env_name="PendulumSwingUp-v0", seed=args.seed)
+    environment.add_wrapper(
+        AdversarialPendulumWrapper,
+        alpha=args.alpha,
+        force_body_names=("mass", "gravity"),
+    )
+    for n_antagonists in args.n_antagonists:
+        num_directories = count_directories()
+        start = time.perf_counter()
+        agent = RAPAgent.default(
+            environment,
+            base_agent_name=args.base_agent_name,
+            n_antagonists=n_antagonists,
+        )
+        elapsed = time.perf_counter() - start
+        print(
+            f"{n_antagonists} antagonists: {elapsed:.2f} s, "
+            f"{count_directories() - num_directories} new log directories"
+        )
+        agent.logger.delete_directory()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser("Benchmark adversarial agent construction.")
+    parser.add_argument("--base-agent-name", type=str, default="PPO")
+    parser.add_argument("--alpha", default=0.1, type=float, help="Antagonist power.")
+    parser.add_argument(
+        "--n-antagonists", type=int, nargs="+", default=[1, 5, 20], help="Sizes."
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random Seed.")
+    main(parser.parse_args())
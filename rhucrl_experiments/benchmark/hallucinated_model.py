@@ -0,0 +1,90 @@
+"""Benchmark imagination rollouts of a hallucinated ensemble model."""
+import argparse
+import time
+
+import torch
+from rllib.dataset.transforms import DeltaState, MeanFunction
+from rllib.model import EnsembleModel
+
+from rhucrl.model import HallucinatedModel
+
+
+def get_model(args):
+    """Get a hallucinated model with an ensemble base model that predicts deltas."""
+    base_model = EnsembleModel(
+        dim_state=(args.dim_state,),
+        dim_action=(args.dim_action,),
+        num_heads=args.num_heads,
+    )
+    transformations = [MeanFunction(DeltaState())]
+    return HallucinatedModel(
+        base_model, transformations=transformations, beta=args.beta
+    )
+
+
+def loop_heads_step(model, state, action):
+    """Predict each head with its own call and apply the optimism of the heads."""
+    dim_action = model.dim_action[0]
+    means = []
+    for head in range(model.base_model.num_heads):
+        model.base_model.set_head(head)
+        means.append(model.predict(state, action[..., :dim_action])[0])
+    mean, tril = model.epistemic_moments(torch.stack(means, -2))
+    optimism_vars = action[..., dim_action:].clamp(-1.0, 1.0)
+    return model.optimistic_mean(mean, tril, optimism_vars)
+
+
+def time_rollout(model, state, actions, step):
+    """Time an imagined rollout of horizon H and return ms per rollout."""
+    start = time.perf_counter()
+    for action in actions:
+        state = step(model, state, action)
+    return 1000 * (time.perf_counter() - start)
+
+
+def main(args):
+    """Compare per-head predictions with a single call that predicts all heads."""
+    torch.set_num_threads(1)
+    torch.manual_seed(args.seed)
+    model = get_model(args)
+    state = torch.randn(args.batch_size, args.dim_state)
+    actions = torch.randn(
+        args.horizon, args.batch_size, args.dim_action + args.dim_state
+    )
+
+    def fused_step(model_, state_, action_):
+        return model_(state_, action_)[0]
+
+    with torch.no_grad():
+        model.base_model.set_prediction_strategy("multi_head")
+        fused = fused_step(model, state, actions[0])
+        model.base_model.set_prediction_strategy("set_head")
+        looped = loop_heads_step(model, state, actions[0])
+    assert torch.allclose(fused, looped, atol=1e-4), "The strategies do not match."
+
+    strategies = [
+        ("loop over heads", "set_head", loop_heads_step),
+        ("moment matching", "moment_matching", fused_step),
+        ("multi-head epistemic", "multi_head", fused_step),
+    ]
+    with torch.no_grad():
+        for name, strategy, step in strategies:
+            model.base_model.set_prediction_strategy(strategy)
+            time_rollout(model, state, actions[:2], step)  # Warm up.
+            ms = min(
+                time_rollout(model, state, actions, step) for _ in range(args.num_iter)
+            )
+            print(f"{name}: {ms:.2f} ms per rollout of horizon {args.horizon}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser("Benchmark hallucinated ensemble rollouts.")
+    parser.add_argument("--dim-state", type=int, default=17, help="State dimension.")
+    parser.add_argument("--dim-action", type=int, default=6, help="Action dimension.")
+    parser.add_argument("--num-heads", type=int, default=5, help="Ensemble heads.")
+    parser.add_argument("--beta", type=float, default=1.0, help="Optimism scale.")
+    parser.add_argument("--batch-size", type=int, default=32, help="Batch size.")
+    parser.add_argument("--horizon", type=int, default=40, help="Rollout horizon.")
+    parser.add_argument("--num-iter", type=int, default=10, help="Repetitions.")
+    parser.add_argument("--seed", type=int, default=0, help="Random Seed.")
+    main(parser.parse_args())
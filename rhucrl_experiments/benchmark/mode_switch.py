@@ -0,0 +1,99 @@
+"""Benchmark the overhead of switching between protagonist and antagonist modes."""
+import argparse
+import time
+
+import torch
+from hucrl.policy.augmented_policy import AugmentedPolicy
+from rllib.policy import NNPolicy
+
+from rhucrl.policy.split_policy import SplitPolicy
+from rhucrl.policy.utilities import AntagonistMode, ProtagonistMode
+
+
+class BaselineSplitPolicy(SplitPolicy):
+    """Split policy whose sub-policies are resolved on every access.
+
+    These are the properties of AdversarialPolicy before the dispatch table.
+    """
+
+    @property
+    def protagonist_policy(self):
+        """Return protagonist policy."""
+        if isinstance(self._protagonist_policy, AugmentedPolicy):
+            return self._protagonist_policy.true_policy
+        else:
+            return self._protagonist_policy
+
+    @property
+    def antagonist_policy(self):
+        """Return antagonist policy."""
+        if isinstance(self._antagonist_policy, AugmentedPolicy):
+            return self._antagonist_policy.true_policy
+        else:
+            return self._antagonist_policy
+
+    @property
+    def hallucination_policy(self):
+        """Return hallucination policy."""
+        if isinstance(self._protagonist_policy, AugmentedPolicy) and self.protagonist:
+            return self._protagonist_policy.hallucination_policy
+        elif isinstance(self._antagonist_policy, AugmentedPolicy) and self.antagonist:
+            return self._antagonist_policy.hallucination_policy
+        else:
+            return self._hallucination_policy
+
+
+def get_policy(args, policy_class=SplitPolicy):
+    """Get a split policy with augmented protagonist and antagonist policies."""
+    dim_state, dim_action = (args.dim_state,), (args.dim_action,)
+
+    def augmented_policy():
+        return AugmentedPolicy(
+            base_policy=NNPolicy(dim_state=dim_state, dim_action=dim_action),
+            hallucination_policy=NNPolicy(dim_state=dim_state, dim_action=dim_state),
+            dim_state=dim_state,
+            dim_action=(args.dim_action + args.dim_state,),
+        )
+
+    return policy_class(
+        dim_state=dim_state,
+        dim_action=(2 * args.dim_action + args.dim_state,),
+        protagonist_policy=augmented_policy(),
+        antagonist_policy=augmented_policy(),
+    )
+
+
+def time_learn_loop(policy, state, num_iter):
+    """Time a loop that evaluates the policy in both modes, as a learn() loop does."""
+    start = time.perf_counter()
+    for _ in range(num_iter):
+        for mode in [ProtagonistMode, AntagonistMode]:
+            with mode(policy):
+                policy(state)
+    return 1e6 * (time.perf_counter() - start) / num_iter
+
+
+def main(args):
+    """Compare the mode switching overhead with the properties of a baseline."""
+    torch.set_num_threads(1)
+    torch.manual_seed(args.seed)
+    policy = get_policy(args)
+    baseline = get_policy(args, BaselineSplitPolicy)
+    baseline.load_state_dict(policy.state_dict())
+    state = torch.randn(args.batch_size, args.dim_state)
+    policies = [("baseline properties", baseline), ("dispatch table", policy)]
+    with torch.no_grad():
+        for name, policy_ in policies:
+            time_learn_loop(policy_, state, 10)  # Warm up.
+            us = time_learn_loop(policy_, state, args.num_iter)
+            print(f"{name}: {us:.1f} us per iteration")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser("Benchmark mode switching of split policies.")
+    parser.add_argument("--dim-state", type=int, default=17, help="State dimension.")
+    parser.add_argument("--dim-action", type=int, default=6, help="Action dimension.")
+    parser.add_argument("--batch-size", type=int, default=1, help="Batch size.")
+    parser.add_argument("--num-iter", type=int, default=10000, help="Iterations.")
+    parser.add_argument("--seed", type=int, default=0, help="Random Seed.")
+    main(parser.parse_args())
@@ -0,0 +1,73 @@
+"""Benchmark single-state inference latency of an exported protagonist policy."""
+import argparse
+import time
+
+import numpy as np
+import torch
+from rllib.policy import NNPolicy
+
+from rhucrl.policy.export import export_protagonist
+from rhucrl.policy.split_policy import SplitPolicy
+
+
+def get_policy(args):
+    """Get a split policy with random weights."""
+    dim_state, dim_action = (args.dim_state,), (args.dim_action,)
+    return SplitPolicy(
+        dim_state=dim_state,
+        dim_action=(2 * args.dim_action + args.dim_state,),
+        protagonist_policy=NNPolicy(dim_state=dim_state, dim_action=dim_action),
+        antagonist_policy=NNPolicy(dim_state=dim_state, dim_action=dim_action),
+        hallucination_policy=NNPolicy(dim_state=dim_state, dim_action=dim_state),
+    )
+
+
+def time_actor(actor, states):
+    """Return the time, in micro-seconds, of each call to the actor."""
+    times = []
+    with torch.no_grad():
+        for _ in range(10):  # Warm up.
+            actor(states[0])
+        for state in states:
+            start = time.perf_counter()
+            actor(state)
+            times.append(1e6 * (time.perf_counter() - start))
+    return np.array(times)
+
+
+def main(args):
+    """Compare eager and exported actors."""
+    torch.set_num_threads(1)
+    torch.manual_seed(args.seed)
+    policy = get_policy(args)
+    states = torch.randn(args.num_calls, args.dim_state)
+
+    with torch.no_grad():
+        eager_policy = time_actor(policy, states)
+    print(
+        f"eager split policy: {np.median(eager_policy):.1f} us "
+        f"(p90 {np.percentile(eager_policy, 90):.1f} us)"
+    )
+    for method in args.methods:
+        actor = export_protagonist(policy, example_state=states[0], method=method)
+        times = time_actor(actor, states)
+        print(
+            f"{method} protagonist: {np.median(times):.1f} us "
+            f"(p90 {np.percentile(times, 90):.1f} us)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser("Benchmark exported protagonist policies.")
+    parser.add_argument("--dim-state", type=int, default=17, help="State dimension.")
+    parser.add_argument("--dim-action", type=int, default=6, help="Action dimension.")
+    parser.add_argument("--num-calls", type=int, default=1000, help="Timed calls.")
+    parser.add_argument(
+        "--methods",
+        type=str,
+        nargs="+",
+        default=["eager", "trace", "compile"],
+        choices=["eager", "trace", "compile"],
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random Seed.")
+    main(parser.parse_args())
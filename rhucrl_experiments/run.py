@@ -1,32 +1,48 @@
 """Python Script Template."""
+from functools import partial
 
 from rllib.util.training.agent_training import evaluate_agent
 from rllib.util.utilities import set_random_seed
 
 from rhucrl.environment import AdversarialEnv
 from rhucrl.environment.wrappers import HallucinationWrapper
+from rhucrl.utilities.async_training import train_agent_async
+from rhucrl.utilities.rollout_workers import train_agent_parallel
 from rhucrl.utilities.training import train_adversarial_agent
 from rhucrl.utilities.util import get_agent, wrap_adversarial_environment
 from rhucrl_experiments.utilities import get_command_line_parser
 
 
+def get_environment(args, env_kwargs=None):
+    """Get the adversarial environment with its wrapper stack."""
+    env_kwargs = dict() if env_kwargs is None else env_kwargs
+    environment = AdversarialEnv(
+        env_name=args.environment, seed=args.seed, **env_kwargs
+    )
+    wrap_adversarial_environment(
+        environment,
+        args.adversarial_wrapper,
+        args.alpha,
+        args.force_body_names,
+        validation=args.action_validation,
+        validation_frequency=args.action_validation_frequency,
+        clip_actions=args.clip_actions,
+    )
+    return environment
+
+
 def init_experiment(args, env_kwargs=None, **kwargs):
     """Initialize experiment to get agent and environment."""
-    env_kwargs = dict() if env_kwargs is None else env_kwargs
     if args.antagonist_name is None:
         args.antagonist_name = args.protagonist_name
 
     arg_dict = vars(args).copy()
     arg_dict.update(kwargs)
+    arg_dict.pop("environment")
     set_random_seed(args.seed)
 
     # %% Get environment.
-    environment = AdversarialEnv(
-        env_name=arg_dict.pop("environment"), seed=args.seed, **env_kwargs
-    )
-    wrap_adversarial_environment(
-        environment, args.adversarial_wrapper, args.alpha, args.force_body_names
-    )
+    environment = get_environment(args, env_kwargs)
 
     # %% Initialize agent.
     agent = get_agent(arg_dict.pop("agent"), environment=environment, **arg_dict)
@@ -45,7 +61,7 @@ def run(args, env_kwargs=None, **kwargs):
     agent, environment = init_experiment(args, env_kwargs, **kwargs)
 
     # %% Train Agent.
-    train_all(agent, environment, args)
+    train_all(agent, environment, args, env_kwargs)
 
     # %% Train Antagonist only.
     train_antagonist(agent, environment, args)
@@ -54,8 +70,40 @@ def run(args, env_kwargs=None, **kwargs):
     evaluate(agent, environment, args)
 
 
-def train_all(agent, environment, args):
-    """Train all agents."""
+def train_all(agent, environment, args, env_kwargs=None):
+    """Train all agents.
+
+    If args.num_workers > 0, the episodes are rolled out by a pool of workers, each
+    with its own copy of the agent and the environment.
+    If args.async_learner, the agent learns in a thread while an actor thread rolls
+    out the episodes.
+    """
+    if args.num_workers > 0:
+        train_agent_parallel(
+            agent=agent,
+            agent_fn=partial(init_experiment, args, env_kwargs),
+            num_episodes=args.train_episodes,
+            max_steps=args.max_steps,
+            num_workers=args.num_workers,
+            max_policy_lag=args.max_policy_lag,
+            print_frequency=1,
+            seed=args.seed,
+            environment=environment,
+            eval_frequency=args.eval_frequency,
+            render=args.render_train,
+        )
+        return
+    if args.async_learner:
+        train_agent_async(
+            agent=agent,
+            environment=environment,
+            num_episodes=args.train_episodes,
+            max_steps=args.max_steps,
+            max_policy_lag=args.max_policy_lag,
+            min_steps_per_update=args.min_steps_per_update,
+            print_frequency=1,
+        )
+        return
     train_adversarial_agent(
         mode="both",
         agent=agent,
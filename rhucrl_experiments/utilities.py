@@ -51,6 +51,37 @@ def get_command_line_parser():
     parser.add_argument("--nominal-model", action="store_true", default=True)
     parser.add_argument("--hallucinate", action="store_true", default=False)
     parser.add_argument("--strong-antagonist", action="store_true", default=False)
+    parser.add_argument(
+        "--fused-policy",
+        action="store_true",
+        default=False,
+        help="Evaluate the split policy members with a single grouped network.",
+    )
+    parser.add_argument(
+        "--prediction-cache",
+        action="store_true",
+        default=False,
+        help="Reuse model predictions between protagonist and antagonist updates.",
+    )
+    parser.add_argument(
+        "--single-pass",
+        action="store_true",
+        default=False,
+        help="Compute protagonist and antagonist losses with one base forward.",
+    )
+    parser.add_argument(
+        "--population",
+        action="store_true",
+        default=False,
+        help="Store the RAP antagonists in a single population policy. The members "
+        "share the critic and the memory of the antagonist.",
+    )
+    parser.add_argument(
+        "--shared-memory",
+        action="store_true",
+        default=False,
+        help="Store the RARL transitions once and give role views to the players.",
+    )
     parser.add_argument("--alpha", default=5.0, type=float, help="Antagonist power.")
 
     parser.add_argument(
@@ -66,6 +97,25 @@ def get_command_line_parser():
         ],
     )
     parser.add_argument("--force-body-names", default=["torso"], type=str, nargs="+")
+    parser.add_argument(
+        "--action-validation",
+        default="full",
+        type=str,
+        choices=["full", "sampled", "off"],
+        help="Check every action, one every k actions, or none.",
+    )
+    parser.add_argument(
+        "--action-validation-frequency",
+        default=1000,
+        type=int,
+        help="Steps between action checks with sampled validation.",
+    )
+    parser.add_argument(
+        "--clip-actions",
+        action="store_true",
+        default=False,
+        help="Clip the actions to the action space of the adversarial wrapper.",
+    )
 
     parser.add_argument(
         "--clip-gradient-val", type=float, default=100.0, help="Maximum gradient norm."
@@ -74,6 +124,32 @@ def get_command_line_parser():
         "--num-steps", type=int, default=1, help="Number of steps to use the model."
     )
     parser.add_argument("--seed", type=int, default=0, help="Random Seed.")
+    parser.add_argument(
+        "--num-workers",
+        type=int,
+        default=0,
+        help="Number of rollout workers. If 0, episodes are rolled out serially.",
+    )
+    parser.add_argument(
+        "--async-learner",
+        action="store_true",
+        default=False,
+        help="Learn in a thread while an actor thread rolls out the episodes.",
+    )
+    parser.add_argument(
+        "--max-policy-lag",
+        type=int,
+        default=1,
+        help="Maximum number of updates (asynchronous learner) or episodes (rollout "
+        "workers) the acting policy may lag.",
+    )
+    parser.add_argument(
+        "--min-steps-per-update",
+        type=int,
+        default=None,
+        help="Number of new steps between asynchronous learner updates. By default, "
+        "the updates follow the training schedule of the agent.",
+    )
     parser.add_argument("--max-steps", type=int, default=1000, help="Maximum steps.")
     parser.add_argument(
         "--train-episodes",